@@ -17,11 +17,13 @@ from grisera import (
 from grisera import ActivityService
 from grisera import NotFoundByIdModel
 
-from activity.activity_model import BasicActivityOutToMongo
 from mongo_service.collection_mapping import Collections
 from mongo_service.mongo_api_service import MongoApiService
 from mongo_service.service_mixins import GenericMongoServiceMixin
 
+# bound once at module load, so hot methods skip the repeated enum attribute lookup
+_ACTIVITY_EXECUTIONS = Collections.ACTIVITY_EXECUTION
+
 
 class ActivityServiceMongoDB(ActivityService, GenericMongoServiceMixin):
     """
@@ -59,7 +61,8 @@ class ActivityServiceMongoDB(ActivityService, GenericMongoServiceMixin):
             Result of request as list of activity objects
         """
         results_dict = self.get_multiple(dataset_id, query)
-        activities = [BasicActivityOut(**result) for result in results_dict]
+        # documents already match the schema, so skip re-validating them on read
+        activities = [BasicActivityOut.construct(**result) for result in results_dict]
         return ActivitiesOut(activities=activities)
 
     def get_activity(
@@ -116,17 +119,80 @@ class ActivityServiceMongoDB(ActivityService, GenericMongoServiceMixin):
         activity_execution_dict["id"] = str(ObjectId())
         activity_execution = BasicActivityExecutionOut(**activity_execution_dict)
 
-        activity_id = activity_execution.activity_id
-        activity = self.get_single_dict(activity_id, dataset_id)
-        activity_executions = activity.get(Collections.ACTIVITY_EXECUTION, [])
-        if activity_executions is None:
-            activity_executions = []
-        activity_executions.append(activity_execution)
-        activity[Collections.ACTIVITY_EXECUTION] = activity_executions
-
-        self.update(activity_id, BasicActivityOutToMongo(**activity), dataset_id)
+        push_result = self.mongo_api_service.push_embedded(
+            Collections.ACTIVITY,
+            activity_execution.activity_id,
+            _ACTIVITY_EXECUTIONS,
+            activity_execution.dict(),
+            dataset_id,
+        )
+        if push_result.matched_count == 0:
+            return NotFoundByIdModel(
+                id=activity_execution.activity_id,
+                errors={"errors": "activity not found"},
+            )
         return ActivityExecutionOut(**activity_execution_dict)
 
+    def add_activity_executions(self, activity_executions: list, dataset_id: Union[int, str]):
+        """
+        Add many activity executions to their activities with a single bulk write.
+        Executions are grouped by activity and appended with one '$push' per activity,
+        so batch ingest does one round-trip instead of one write per execution.
+
+        Args:
+            activity_executions (list): activity executions to add, as ActivityExecutionIn
+            dataset_id (int | str): name of dataset
+
+        Returns:
+            Results in input order: ActivityExecutionOut for added executions,
+            NotFoundByIdModel for executions whose activity does not exist
+        """
+        validated_executions = []
+        for activity_execution in activity_executions:
+            activity_execution_dict = activity_execution.dict()
+            activity_execution_dict["id"] = str(ObjectId())
+            validated = BasicActivityExecutionOut(**activity_execution_dict)
+            validated_executions.append((activity_execution_dict, validated))
+
+        # referenced activities are validated with one '$in' query matching only the
+        # ids, mirroring the single-item path's matched_count check; executions of
+        # missing activities would otherwise be dropped server side while still being
+        # reported as created
+        activity_ids = {
+            validated.activity_id for _, validated in validated_executions
+        }
+        existing_activities = self.mongo_api_service.get_many_by_ids(
+            Collections.ACTIVITY,
+            list(activity_ids),
+            dataset_id,
+            projection={self.mongo_api_service.MONGO_ID_FIELD: 1},
+        ) if activity_ids else {}
+
+        results = []
+        executions_by_activity_id = {}
+        for activity_execution_dict, validated in validated_executions:
+            if str(validated.activity_id) not in existing_activities:
+                results.append(
+                    NotFoundByIdModel(
+                        id=validated.activity_id,
+                        errors={"errors": "activity not found"},
+                    )
+                )
+                continue
+            executions_by_activity_id.setdefault(validated.activity_id, []).append(
+                validated.dict()
+            )
+            results.append(ActivityExecutionOut(**activity_execution_dict))
+
+        if executions_by_activity_id:
+            self.mongo_api_service.bulk_push_embedded(
+                Collections.ACTIVITY,
+                _ACTIVITY_EXECUTIONS,
+                executions_by_activity_id,
+                dataset_id,
+            )
+        return results
+
     def update_activity_execution(
         self,
         activity_execution_id: Union[int, str],
@@ -145,26 +211,55 @@ class ActivityServiceMongoDB(ActivityService, GenericMongoServiceMixin):
             Updated activity execution
         """
         activity_id = activity_execution_dict["activity_id"]
-        activity = self.get_single_dict(activity_id, dataset_id)
-        if type(activity) is NotFoundByIdModel:
+        new_activity_execution = BasicActivityExecutionOut(**activity_execution_dict)
+        update_result = self.mongo_api_service.update_embedded(
+            Collections.ACTIVITY,
+            activity_id,
+            _ACTIVITY_EXECUTIONS,
+            activity_execution_id,
+            new_activity_execution.dict(),
+            dataset_id,
+        )
+        if update_result.matched_count == 0:
             return NotFoundByIdModel(
                 id=activity_execution_id,
-                errors={
-                    "errors": "activity related to given activity execution not found"
-                },
+                errors={"errors": "activity execution not found"},
             )
+        return ActivityExecutionOut(**activity_execution_dict)
+
+    def update_activity_execution_fields(
+        self,
+        activity_execution_id: Union[int, str],
+        activity_execution_dict: dict,
+        fields_to_update: dict,
+        dataset_id: Union[int, str],
+    ):
+        """
+        Update only given fields of activity execution embedded in activity. Cheaper
+        than update_activity_execution, as only the changed fields are sent.
 
-        to_update_index = self._get_activity_execution_index_from_activity(
-            activity, activity_execution_id
+        Args:
+            activity_execution_id (Union[int, str]): id of activity execution that is to be updated
+            activity_execution_dict (dict): full new version of activity execution
+            fields_to_update (dict): fields that actually changed
+            dataset_id (int | str): name of dataset
+
+        Returns:
+            Updated activity execution
+        """
+        update_result = self.mongo_api_service.update_embedded_fields(
+            Collections.ACTIVITY,
+            activity_execution_dict["activity_id"],
+            _ACTIVITY_EXECUTIONS,
+            activity_execution_id,
+            fields_to_update,
+            dataset_id,
         )
-        if to_update_index is None:
+        if update_result.matched_count == 0:
             return NotFoundByIdModel(
                 id=activity_execution_id,
                 errors={"errors": "activity execution not found"},
             )
-        activity_executions = activity[Collections.ACTIVITY_EXECUTION]
-        activity_executions[to_update_index] = BasicActivityExecutionOut(**activity_execution_dict)
-        self.update(activity_id, BasicActivityOutToMongo(**activity), dataset_id)
         return ActivityExecutionOut(**activity_execution_dict)
 
     def remove_activity_execution(self, activity_execution: ActivityExecutionOut, dataset_id: Union[int, str]):
@@ -178,44 +273,44 @@ class ActivityServiceMongoDB(ActivityService, GenericMongoServiceMixin):
         Returns:
             Removed activity execution
         """
-        activity_id = activity_execution.activity_id
-        activity = self.get_single_dict(activity_id, dataset_id)
-        if type(activity) is NotFoundByIdModel:
-            return NotFoundByIdModel(
-                id=activity_execution.id,
-                errors={
-                    "errors": "activity related to given activity execution not found"
-                },
-            )
-
-        to_remove_index = self._get_activity_execution_index_from_activity(
-            activity, activity_execution.id
+        result = self.remove_activity_execution_by_ids(
+            activity_execution.activity_id, activity_execution.id, dataset_id
         )
-        if to_remove_index is None:
-            return NotFoundByIdModel(
-                id=activity_execution.id,
-                errors={"errors": "activity execution not found"},
-            )
-        del activity[Collections.ACTIVITY_EXECUTION][to_remove_index]
-
-        self.update(activity_id, BasicActivityOutToMongo(**activity), dataset_id)
+        if type(result) is NotFoundByIdModel:
+            return result
         return activity_execution
 
-    def _get_activity_execution_index_from_activity(
-        self, activity_dict: dict, activity_execution_id: Union[str, int]
+    def remove_activity_execution_by_ids(
+        self,
+        activity_id: Union[int, str],
+        activity_execution_id: Union[int, str],
+        dataset_id: Union[int, str],
     ):
         """
-        Activity execution is embedded within activity model
+        Remove activity execution from activity by ids. Avoids fetching and validating
+        the execution when the caller already resolved it.
+
+        Args:
+            activity_id (int | str): id of activity the execution is embedded in
+            activity_execution_id (int | str): id of activity execution to remove
+            dataset_id (int | str): name of dataset
+
+        Returns:
+            None on success, NotFoundByIdModel when the execution does not exist
         """
-        activity_executions = activity_dict[Collections.ACTIVITY_EXECUTION]
-        return next(
-            (
-                i
-                for i, oi in enumerate(activity_executions)
-                if ObjectId(oi["id"]) == ObjectId(activity_execution_id)
-            ),
-            None,
+        pull_result = self.mongo_api_service.pull_embedded(
+            Collections.ACTIVITY,
+            activity_id,
+            _ACTIVITY_EXECUTIONS,
+            activity_execution_id,
+            dataset_id,
         )
+        if pull_result.matched_count == 0:
+            return NotFoundByIdModel(
+                id=activity_execution_id,
+                errors={"errors": "activity execution not found"},
+            )
+        return None
 
     def _add_related_documents(self, activity: dict, dataset_id: Union[int, str], depth: int, source: str):
         if depth > 0:
@@ -225,9 +320,9 @@ class ActivityServiceMongoDB(ActivityService, GenericMongoServiceMixin):
         """
         Observable information is embedded within recording model
         """
-        has_activity_executions = Collections.ACTIVITY_EXECUTION in activity and activity[Collections.ACTIVITY_EXECUTION] is not None
-        if source != Collections.ACTIVITY_EXECUTION and has_activity_executions:
-            for ae in activity[Collections.ACTIVITY_EXECUTION]:
+        activity_executions = activity.get(_ACTIVITY_EXECUTIONS)
+        if source != _ACTIVITY_EXECUTIONS and activity_executions:
+            for ae in activity_executions:
                 self.activity_execution_service._add_related_documents(
                     ae, dataset_id, depth - 1, Collections.ACTIVITY, activity
                 )
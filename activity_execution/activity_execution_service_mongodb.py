@@ -1,5 +1,7 @@
+from functools import lru_cache
 from typing import Union
 
+import pymongo
 from bson import ObjectId
 
 from grisera import (
@@ -19,6 +21,9 @@ from mongo_service.service_mixins import GenericMongoServiceMixin
 from grisera import ParticipationService
 from grisera import ScenarioService
 
+# joined once at module load, so the hot query-rewriting path only concatenates
+_ACTIVITY_EXECUTION_PREFIX = f"{Collections.ACTIVITY_EXECUTION}."
+
 
 class ActivityExecutionServiceMongoDB(
     ActivityExecutionService, GenericMongoServiceMixin
@@ -27,6 +32,12 @@ class ActivityExecutionServiceMongoDB(
     Object to handle logic of activities requests
     """
 
+    # multikey index on embedded execution ids, so lookups by execution id are an
+    # index seek instead of a scan over all activity documents
+    ACTIVITY_EXECUTION_ID_INDEX = [
+        (f"{Collections.ACTIVITY_EXECUTION}.id", pymongo.ASCENDING)
+    ]
+
     def __init__(self):
         super().__init__()
         self.model_out_class = ActivityExecutionOut
@@ -46,27 +57,15 @@ class ActivityExecutionServiceMongoDB(
         Returns:
             Result of request as activity execution object
         """
-        related_activity = self.activity_service.get_activity(
-            activity_execution.activity_id,
-            dataset_id
-        )
-        related_activity_exists = type(related_activity) is not NotFoundByIdModel
-        if (
-            activity_execution.activity_id is not None
-            and not related_activity_exists
+        if activity_execution.activity_id is not None and not self.activity_service.exists(
+            activity_execution.activity_id, dataset_id
         ):
             return ActivityExecutionOut(
                 errors={"errors": "given activity does not exist"}
             )
 
-        related_arrangement = self.arrangement_service.get_arrangement(
-            activity_execution.arrangement_id,
-            dataset_id
-        )
-        related_arrangement_exists = type(related_arrangement) is not NotFoundByIdModel
-        if (
-            activity_execution.arrangement_id is not None
-            and not related_arrangement_exists
+        if activity_execution.arrangement_id is not None and not self.arrangement_service.exists(
+            activity_execution.arrangement_id, dataset_id
         ):
             return ActivityExecutionOut(
                 errors={"errors": "given arrangement does not exist"}
@@ -81,33 +80,55 @@ class ActivityExecutionServiceMongoDB(
         Get multiple activity executions based on query. Query has to be adjusted, as activity execution
         documents are embedded within activity documents.
         """
-        activity_query = {
-            f"{Collections.ACTIVITY_EXECUTION}.{field}": value
-            for field, value in query.items()
-        }
-        activity_results = self.activity_service.get_multiple(
+        self.mongo_api_service.ensure_index(
+            Collections.ACTIVITY, self.ACTIVITY_EXECUTION_ID_INDEX, dataset_id
+        )
+        if query:
+            activity_query = {
+                _ACTIVITY_EXECUTION_PREFIX + field: value
+                for field, value in query.items()
+            }
+        else:
+            activity_query = {}
+        activity_results = self.activity_service.iter_multiple(
             dataset_id,
             activity_query,
             depth=depth - 1,
             source=Collections.ACTIVITY_EXECUTION,
-            projection=self._get_activity_projection(query),
+            projection=self._get_activity_projection(query, depth, source),
         )
-        result = []
+        executions_with_activities = []
         for activity_result in activity_results:
             if "activity_executions" in activity_result:
                 activity_executions = activity_result["activity_executions"]
                 del activity_result["activity_executions"]
-                for activity_execution in activity_executions:
-                    self._add_related_documents(
-                        activity_execution,
-                        dataset_id,
-                        depth,
-                        source,
-                        activity_result,
-                    )
-                result += activity_executions
-
-        return result
+                executions_with_activities += [
+                    (activity_execution, activity_result)
+                    for activity_execution in activity_executions
+                ]
+
+        participations_by_execution = self._prefetch_related_participations(
+            [ae for ae, _ in executions_with_activities], dataset_id, depth, source
+        )
+        arrangements_by_id = self._prefetch_related_arrangements(
+            [ae for ae, _ in executions_with_activities], dataset_id, depth, source
+        )
+        scenarios_by_execution = self._prefetch_related_scenarios(
+            [ae for ae, _ in executions_with_activities], dataset_id, depth, source
+        )
+        for activity_execution, activity_result in executions_with_activities:
+            self._add_related_documents(
+                activity_execution,
+                dataset_id,
+                depth,
+                source,
+                activity_result,
+                participations_by_execution=participations_by_execution,
+                arrangements_by_id=arrangements_by_id,
+                scenarios_by_execution=scenarios_by_execution,
+            )
+
+        return [ae for ae, _ in executions_with_activities]
 
     def get_activity_executions(self, dataset_id: Union[int, str]):
         """
@@ -117,8 +138,10 @@ class ActivityExecutionServiceMongoDB(
             Result of request as list of activity executions objects
         """
         activity_execution_dicts = self.get_multiple(dataset_id)
+        # documents already match the schema, so skip re-validating them on read
         activity_executions = [
-            BasicActivityExecutionOut(**result) for result in activity_execution_dicts
+            BasicActivityExecutionOut.construct(**result)
+            for result in activity_execution_dicts
         ]
         return ActivityExecutionsOut(activity_executions=activity_executions)
 
@@ -128,25 +151,25 @@ class ActivityExecutionServiceMongoDB(
         """
         Get activity execution dict. Activity executions are fetched from activity documents
         """
+        self.mongo_api_service.ensure_index(
+            Collections.ACTIVITY, self.ACTIVITY_EXECUTION_ID_INDEX, dataset_id
+        )
         activity_execution_object_id = ObjectId(id)
-        activity_result = self.activity_service.get_multiple(
-            dataset_id,
+        related_activity = self.mongo_api_service.get_document_by_query(
             {f"{Collections.ACTIVITY_EXECUTION}.id": activity_execution_object_id},
-            depth=depth - 1,
-            source=Collections.ACTIVITY_EXECUTION,
-            projection=self._get_activity_projection(
-                {"id": activity_execution_object_id}
+            Collections.ACTIVITY,
+            dataset_id,
+            self._get_activity_projection(
+                {"id": activity_execution_object_id}, depth, source
             ),
         )
-        if (
-            len(activity_result) == 0
-            or len(activity_result[0][Collections.ACTIVITY_EXECUTION]) == 0
+        if related_activity is None or not related_activity.get(
+            Collections.ACTIVITY_EXECUTION
         ):
             return NotFoundByIdModel(
                 id=id,
                 errors={"errors": "activity execution not found"},
             )
-        related_activity = activity_result[0]
         activity_execution_dict = related_activity[Collections.ACTIVITY_EXECUTION][0]
         del related_activity[Collections.ACTIVITY_EXECUTION]
         self._add_related_documents(
@@ -193,13 +216,18 @@ class ActivityExecutionServiceMongoDB(
         Returns:
             Result of request as activity execution object
         """
-        activity_execution = self.get_activity_execution(activity_execution_id, dataset_id)
-        if type(activity_execution) is NotFoundByIdModel:
+        activity_execution_dict = self.get_single_dict(activity_execution_id, dataset_id)
+        if type(activity_execution_dict) is NotFoundByIdModel:
             return NotFoundByIdModel(
                 id=activity_execution_id,
                 errors={"errors": "activity execution not found"},
             )
-        return self.activity_service.remove_activity_execution(activity_execution, dataset_id)
+        result = self.activity_service.remove_activity_execution_by_ids(
+            activity_execution_dict["activity_id"], activity_execution_id, dataset_id
+        )
+        if type(result) is NotFoundByIdModel:
+            return result
+        return ActivityExecutionOut(**activity_execution_dict)
 
     def update_activity_execution(
         self,
@@ -216,11 +244,22 @@ class ActivityExecutionServiceMongoDB(
             Result of request as participant state object
         """
         existing_activity_execution = self.get_activity_execution(activity_execution_id, dataset_id)
-        for field, value in activity_execution.dict().items():
-            setattr(existing_activity_execution, field, value)
+        if type(existing_activity_execution) is NotFoundByIdModel:
+            return existing_activity_execution
 
-        return self.activity_service.update_activity_execution(
-            activity_execution_id, existing_activity_execution.dict(), dataset_id
+        changed_fields = {
+            field: value
+            for field, value in activity_execution.dict().items()
+            if getattr(existing_activity_execution, field) != value
+        }
+        if not changed_fields:
+            return existing_activity_execution
+
+        return self.activity_service.update_activity_execution_fields(
+            activity_execution_id,
+            {**existing_activity_execution.dict(), **changed_fields},
+            changed_fields,
+            dataset_id,
         )
 
     def update_activity_execution_relationships(
@@ -237,40 +276,100 @@ class ActivityExecutionServiceMongoDB(
         Returns:
             Result of request as activity execution object
         """
-        existing_activity_execution = self.get_activity_execution(activity_execution_id, dataset_id)
+        (
+            existing_execution_dict,
+            activity_exists,
+            arrangement_exists,
+        ) = self._get_relationships_update_context(
+            activity_execution_id,
+            activity_execution.activity_id,
+            activity_execution.arrangement_id,
+            dataset_id,
+        )
 
-        if type(existing_activity_execution) is NotFoundByIdModel:
-            return existing_activity_execution
+        if existing_execution_dict is None:
+            return NotFoundByIdModel(
+                id=activity_execution_id,
+                errors={"errors": "activity execution not found"},
+            )
 
-        related_activity = self.activity_service.get_activity(
-            activity_execution.activity_id, dataset_id
-        )
-        related_activity_exists = type(related_activity) is not NotFoundByIdModel
-        if not related_activity_exists:
+        if not activity_exists:
             return ActivityExecutionOut(
                 errors={"errors": "given activity does not exist"}
             )
 
-        related_arrangement = self.arrangement_service.get_arrangement(
-            activity_execution.arrangement_id,
-            dataset_id
-        )
-        related_arrangement_exists = type(related_arrangement) is not NotFoundByIdModel
-        if (
-            activity_execution.arrangement_id is not None
-            and not related_arrangement_exists
-        ):
+        if activity_execution.arrangement_id is not None and not arrangement_exists:
             return ActivityExecutionOut(
                 errors={"errors": "given arrangement does not exist"}
             )
 
-        for field, value in activity_execution.dict().items():
-            setattr(existing_activity_execution, field, value)
-
         return self.activity_service.update_activity_execution(
-            activity_execution_id, existing_activity_execution.dict(), dataset_id
+            activity_execution_id,
+            {**existing_execution_dict, **activity_execution.dict()},
+            dataset_id,
         )
 
+    def _get_relationships_update_context(
+        self,
+        activity_execution_id: Union[int, str],
+        activity_id: Union[int, str],
+        arrangement_id: Union[int, str],
+        dataset_id: Union[int, str],
+    ):
+        """
+        Fetch the existing activity execution together with existence flags for the
+        related activity and arrangement in two round-trips, instead of three
+        sequential queries. The arrangement is checked through the cached exists
+        instead of a '$unionWith' stage, which would require MongoDB 4.4.
+        """
+        activity_execution_object_id = ObjectId(activity_execution_id)
+        activity_object_id = ObjectId(activity_id)
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {"_id": activity_object_id},
+                        {
+                            f"{Collections.ACTIVITY_EXECUTION}.id": activity_execution_object_id
+                        },
+                    ]
+                }
+            },
+            {
+                "$project": {
+                    "_id": 1,
+                    Collections.ACTIVITY_EXECUTION.value: {
+                        "$filter": {
+                            "input": {
+                                "$ifNull": [f"${Collections.ACTIVITY_EXECUTION}", []]
+                            },
+                            "as": "ae",
+                            "cond": {"$eq": ["$$ae.id", activity_execution_object_id]},
+                        }
+                    },
+                }
+            },
+        ]
+
+        results = self.mongo_api_service.aggregate(
+            Collections.ACTIVITY, pipeline, dataset_id
+        )
+
+        existing_execution_dict = None
+        activity_exists = False
+        target_activity_id = str(activity_object_id)
+        for result in results:
+            if result["_id"] == target_activity_id:
+                activity_exists = True
+            if result.get(Collections.ACTIVITY_EXECUTION):
+                existing_execution_dict = result[Collections.ACTIVITY_EXECUTION][0]
+
+        arrangement_exists = arrangement_id is not None and self.arrangement_service.exists(
+            arrangement_id, dataset_id
+        )
+
+        return existing_execution_dict, activity_exists, arrangement_exists
+
     def _add_related_documents(
         self,
         activity_execution: dict,
@@ -278,37 +377,144 @@ class ActivityExecutionServiceMongoDB(
         depth: int,
         source: str,
         activity: dict,
+        participations_by_execution: dict = None,
+        arrangements_by_id: dict = None,
+        scenarios_by_execution: dict = None,
     ):
         """Recording is taken from previous get query"""
         source = source if source != "" else Collections.ACTIVITY_EXECUTION
         if depth > 0:
-            self._add_related_arrangement(activity_execution, dataset_id, depth, source)
-            self._add_related_experiments(activity_execution, dataset_id, depth, source)
-            self._add_related_participations(activity_execution, dataset_id, depth, source)
+            self._add_related_arrangement(
+                activity_execution, dataset_id, depth, source, arrangements_by_id
+            )
+            self._add_related_experiments(
+                activity_execution, dataset_id, depth, source, scenarios_by_execution
+            )
+            self._add_related_participations(
+                activity_execution, dataset_id, depth, source, participations_by_execution
+            )
             self._add_activity(activity_execution, dataset_id, depth, source, activity)
 
+    def _prefetch_related_participations(
+        self, activity_executions: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Fetch participations for all given activity executions with a single query and
+        group them by activity execution id. Used to avoid per-execution queries in
+        get_multiple.
+        """
+        source = source if source != "" else Collections.ACTIVITY_EXECUTION
+        if depth <= 0 or source == Collections.PARTICIPATION or not activity_executions:
+            return None
+
+        participations = self.participation_service.get_multiple(
+            dataset_id,
+            {
+                "activity_execution_id": self.mongo_api_service.get_id_in_query(
+                    [ae["id"] for ae in activity_executions]
+                )
+            },
+            depth=depth - 1,
+            source=source,
+        )
+        participations_by_execution = {ae["id"]: [] for ae in activity_executions}
+        for participation in participations:
+            participations_by_execution[participation["activity_execution_id"]].append(
+                participation
+            )
+        return participations_by_execution
+
+    def _prefetch_related_arrangements(
+        self, activity_executions: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Fetch arrangements related to given activity executions with a single query and
+        group them by id. Used to avoid per-execution queries in get_multiple.
+        """
+        source = source if source != "" else Collections.ACTIVITY_EXECUTION
+        arrangement_ids = {
+            ae["arrangement_id"]
+            for ae in activity_executions
+            if ae["arrangement_id"] is not None
+        }
+        if depth <= 0 or source == Collections.ARRANGEMENT or not arrangement_ids:
+            return None
+
+        arrangements = self.arrangement_service.get_multiple(
+            dataset_id,
+            {"_id": self.mongo_api_service.get_id_in_query(arrangement_ids)},
+            depth=depth - 1,
+            source=source,
+        )
+        return {arrangement["id"]: arrangement for arrangement in arrangements}
+
     def _add_related_experiments(
-        self, activity_execution: dict, dataset_id: Union[int, str], depth: int, source: str
+        self,
+        activity_execution: dict,
+        dataset_id: Union[int, str],
+        depth: int,
+        source: str,
+        scenarios_by_execution: dict = None,
     ):
         if depth <= 0 or source == Collections.EXPERIMENT or source == Collections.SCENARIO:
             return
 
-        related_scenarios = self.scenario_service.get_scenario_by_activity_execution(
-            activity_execution["id"], dataset_id, depth=depth, multiple=True, source=source
-        )
-        if type(related_scenarios) is NotFoundByIdModel:
-            return
+        if scenarios_by_execution is not None:
+            related_scenarios = scenarios_by_execution.get(activity_execution["id"], [])
+            if not related_scenarios:
+                return
+        else:
+            related_scenarios = self.scenario_service.get_scenario_by_activity_execution(
+                activity_execution["id"], dataset_id, depth=depth, multiple=True, source=source
+            )
+            if type(related_scenarios) is NotFoundByIdModel:
+                return
 
         activity_execution["experiments"] = [
             scenario.experiment for scenario in related_scenarios
         ]
 
+    def _prefetch_related_scenarios(
+        self, activity_executions: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Fetch scenarios for all given activity executions with a single query and group
+        them by activity execution id. Used to avoid per-execution queries in
+        get_multiple.
+        """
+        source = source if source != "" else Collections.ACTIVITY_EXECUTION
+        if (
+            depth <= 0
+            or source == Collections.EXPERIMENT
+            or source == Collections.SCENARIO
+            or not activity_executions
+        ):
+            return None
+
+        return self.scenario_service.get_scenarios_by_activity_execution_ids(
+            [ae["id"] for ae in activity_executions],
+            dataset_id,
+            depth=depth,
+            source=source,
+        )
+
     def _add_related_participations(
-        self, activity_execution: dict, dataset_id: Union[int, str], depth: int, source: str
+        self,
+        activity_execution: dict,
+        dataset_id: Union[int, str],
+        depth: int,
+        source: str,
+        participations_by_execution: dict = None,
     ):
         if depth <= 0 or source == Collections.PARTICIPATION:
             return
 
+        if participations_by_execution is not None:
+            activity_execution["participations"] = participations_by_execution.get(
+                activity_execution["id"], []
+            )
+            return
+
         activity_execution[
             "participations"
         ] = self.participation_service.get_multiple(
@@ -319,12 +525,23 @@ class ActivityExecutionServiceMongoDB(
         )
 
     def _add_related_arrangement(
-        self, activity_execution: dict, dataset_id: Union[int, str], depth: int, source: str
+        self,
+        activity_execution: dict,
+        dataset_id: Union[int, str],
+        depth: int,
+        source: str,
+        arrangements_by_id: dict = None,
     ):
         has_related_arrangement = activity_execution["arrangement_id"] is not None
         if depth <= 0 or source == Collections.ARRANGEMENT or not has_related_arrangement:
             return
 
+        if arrangements_by_id is not None:
+            activity_execution["arrangement"] = arrangements_by_id.get(
+                activity_execution["arrangement_id"]
+            )
+            return
+
         activity_execution[
             "arrangement"
         ] = self.arrangement_service.get_single_dict(
@@ -344,11 +561,43 @@ class ActivityExecutionServiceMongoDB(
         activity_execution["activity"] = ActivityOut(**activity)
 
     @staticmethod
-    def _get_activity_projection(query):
-        return {
-            "activity_executions": {"$elemMatch": query} if query else 1,
-            "additional_properties": 1,
-            "activity": 1,
-            "activity_id": 1,
-            "arrangement_id": 1,
-        }
+    def _get_activity_projection(query, depth: int = 0, source: str = ""):
+        """
+        Project only the embedded executions, unless the parent activity body is needed
+        to embed it in the response (_add_activity), to avoid fetching unused fields.
+        Projections are cached by query shape, as the same few shapes repeat on every
+        read.
+        """
+        source = source if source != "" else Collections.ACTIVITY_EXECUTION
+        include_activity = depth > 0 and source != Collections.ACTIVITY
+        if not query:
+            return (
+                _EMPTY_QUERY_PROJECTION_WITH_ACTIVITY
+                if include_activity
+                else _EMPTY_QUERY_PROJECTION
+            )
+        try:
+            return _cached_activity_projection(frozenset(query.items()), include_activity)
+        except TypeError:  # query values that are not hashable cannot be cached
+            return _build_activity_projection(query, include_activity)
+
+
+_EMPTY_QUERY_PROJECTION = {"activity_executions": 1}
+_EMPTY_QUERY_PROJECTION_WITH_ACTIVITY = {
+    "activity_executions": 1,
+    "additional_properties": 1,
+    "activity": 1,
+}
+
+
+def _build_activity_projection(query: dict, include_activity: bool):
+    projection = {"activity_executions": {"$elemMatch": query}}
+    if include_activity:
+        projection["additional_properties"] = 1
+        projection["activity"] = 1
+    return projection
+
+
+@lru_cache(maxsize=128)
+def _cached_activity_projection(query_items: frozenset, include_activity: bool):
+    return _build_activity_projection(dict(query_items), include_activity)
@@ -1,5 +1,7 @@
 from typing import Union
 
+import pymongo
+
 from grisera import (
     AppearanceOcclusionIn,
     AppearanceOcclusionOut,
@@ -13,19 +15,78 @@ from grisera import AppearanceService
 from grisera import NotFoundByIdModel
 from mongo_service.collection_mapping import Collections
 from mongo_service.mongo_api_service import MongoApiService
+from mongo_service.request_cache import get_cached, set_cached
 from mongo_service.service_mixins import GenericMongoServiceMixin
 from grisera import ParticipantStateService
 
+# computed once at module load; list endpoint hydrates basic occlusion or somatotype
+# models ('glasses' is the discriminator between them), so only their fields are
+# fetched from mongo
+_APPEARANCE_LIST_PROJECTION = {
+    field: 1
+    for field in (
+        set(BasicAppearanceOcclusionOut.__fields__)
+        | set(BasicAppearanceSomatotypeOut.__fields__)
+        | {"glasses"}
+    )
+}
+
+
+# field present only on occlusion documents, used to tell the two appearance
+# variants apart; bound once at module load
+_OCCLUSION_DISCRIMINATOR = "glasses"
+
+_SOMATOTYPE_ERR = "Scale range not between 1 and 7"
+
+# collection sentinels used in the traversal hot paths, bound once at module load so
+# the hooks skip the repeated enum attribute lookups
+_PARTICIPANT = Collections.PARTICIPANT
+_PARTICIPANT_STATE = Collections.PARTICIPANT_STATE
+_APPEARANCE = Collections.APPEARANCE
+
+
+def _somatotype_scale_valid(appearance: AppearanceSomatotypeIn):
+    """
+    Somatotype dimensions are graded on a 1-7 scale; fractional values are allowed.
+    """
+    return all(
+        1 <= value <= 7
+        for value in (appearance.ectomorph, appearance.endomorph, appearance.mesomorph)
+    )
+
+
+def _somatotype_scale_error(appearance: AppearanceSomatotypeIn):
+    """
+    Build the out-of-range error response. The response only echoes the three
+    dimensions back, so it is constructed from them directly without serializing the
+    whole input model or running validators.
+    """
+    return AppearanceSomatotypeOut.construct(
+        ectomorph=appearance.ectomorph,
+        endomorph=appearance.endomorph,
+        mesomorph=appearance.mesomorph,
+        errors=_SOMATOTYPE_ERR,
+    )
+
 
 class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
     """
     Object to handle logic of appearance requests
     """
 
+    # index on the embedded foreign key queried by the participant-state traversal,
+    # so the lookups scan the index instead of the whole participants collection
+    PARTICIPANT_STATE_APPEARANCE_IDS_INDEX = [
+        (f"{Collections.PARTICIPANT_STATE}.appearance_ids", pymongo.ASCENDING)
+    ]
+
+    # both appearance variants live in one collection, so either class resolves the
+    # collection name; result variants are picked per call via create(out_class=...)
+    model_out_class = AppearanceSomatotypeOut
+
     def __init__(self):
         self.mongo_api_service = MongoApiService()
         self.participant_state_service: ParticipantStateService = None
-        self.model_out_class = AppearanceSomatotypeOut
 
     def save_appearance_occlusion(self, appearance: AppearanceOcclusionIn, dataset_id: Union[int, str]):
         """
@@ -38,8 +99,7 @@ class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
         Returns:
             Result of request as appearance state object
         """
-        self.model_out_class = AppearanceOcclusionOut
-        return self.create(appearance, dataset_id)
+        return self.create(appearance, dataset_id, out_class=AppearanceOcclusionOut)
 
     def save_appearance_somatotype(self, appearance: AppearanceSomatotypeIn, dataset_id: Union[int, str]):
         """
@@ -53,19 +113,16 @@ class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
             Result of request as appearance state object
         """
 
-        if (
-            not 1 <= appearance.ectomorph <= 7
-            or not 1 <= appearance.endomorph <= 7
-            or not 1 <= appearance.mesomorph <= 7
-        ):
-            return AppearanceSomatotypeOut(
-                ectomorph=appearance.ectomorph,
-                endomorph=appearance.endomorph,
-                mesomorph=appearance.mesomorph,
-                errors="Scale range not between 1 and 7",
-            )
-        self.model_out_class = AppearanceSomatotypeOut
-        return self.create(appearance, dataset_id)
+        if not _somatotype_scale_valid(appearance):
+            return _somatotype_scale_error(appearance)
+        return self.create(appearance, dataset_id, out_class=AppearanceSomatotypeOut)
+
+    def _out_model_for_document(self, document: dict):
+        return (
+            AppearanceOcclusionOut
+            if _OCCLUSION_DISCRIMINATOR in document
+            else AppearanceSomatotypeOut
+        )
 
     def get_single(self, id: Union[str, int], dataset_id: Union[int, str], depth: int = 0, source: str = "", *args, **kwargs):
         appearance = self.get_single_dict(id, dataset_id, depth, source)
@@ -73,7 +130,7 @@ class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
             return appearance
         return (
             AppearanceOcclusionOut(**appearance)
-            if "glasses" in appearance.keys()
+            if _OCCLUSION_DISCRIMINATOR in appearance
             else AppearanceSomatotypeOut(**appearance)
         )
 
@@ -94,25 +151,35 @@ class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
         """
         return self.get_single(appearance_id, dataset_id, depth, source)
 
-    def get_appearances(self, dataset_id: Union[int, str], query: dict = {}):
+    def get_appearances(self, dataset_id: Union[int, str], query: dict = {}, depth: int = 0):
         """
         Send request to mongo api to get appearances
 
         Args:
             dataset_id (int | str): name of dataset
             query: Query to mongo api. Empty by default.
+            depth: (int): specifies how many related entities will be traversed to create the response
 
         Returns:
             Result of request as list of appearances objects
         """
-        results_dict = self.get_multiple(dataset_id, query)
-        appearances = []
-        for appearance_dict in results_dict:
-            appearances.append(
-                BasicAppearanceOcclusionOut(**appearance_dict)
-                if "glasses" in appearance_dict.keys()
-                else BasicAppearanceSomatotypeOut(**appearance_dict)
+        if depth > 0:
+            results_dict = self.mongo_api_service.aggregate(
+                Collections.APPEARANCE,
+                self._appearances_with_states_pipeline(query),
+                dataset_id,
+            )
+        else:
+            results_dict = self.get_multiple(
+                dataset_id, query, projection=_APPEARANCE_LIST_PROJECTION
             )
+        # construct skips per-document validation; the discriminator branch stays
+        appearances = [
+            BasicAppearanceOcclusionOut.construct(**appearance_dict)
+            if _OCCLUSION_DISCRIMINATOR in appearance_dict
+            else BasicAppearanceSomatotypeOut.construct(**appearance_dict)
+            for appearance_dict in results_dict
+        ]
         return AppearancesOut(appearances=appearances)
 
     def delete_appearance(self, appearance_id: Union[int, str], dataset_id: Union[int, str]):
@@ -143,16 +210,18 @@ class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
         Returns:
             Result of request as appearance object
         """
-        get_response = self.get_single(appearance_id, dataset_id)
-
-        if type(get_response) is NotFoundByIdModel:
-            return get_response
-        if type(get_response) is AppearanceSomatotypeOut:
+        # matching on the 'glasses' discriminator folds the occlusion type check, the
+        # update and the read of the new version into one atomic round trip
+        updated_appearance = self.mongo_api_service.find_one_and_update(
+            appearance_id,
+            appearance,
+            dataset_id,
+            query={"glasses": {"$exists": True}},
+        )
+        if updated_appearance is None:
             return NotFoundByIdModel(id=appearance_id, errors="Node not found.")
-
-        self.mongo_api_service.update_document(appearance_id, appearance, dataset_id)
-
-        return self.get_single(appearance_id, dataset_id)
+        self._invalidate_request_cache(appearance_id, dataset_id)
+        return AppearanceOcclusionOut(**updated_appearance)
 
     def update_appearance_somatotype(
         self, appearance_id: Union[int, str], appearance: AppearanceSomatotypeIn,
@@ -169,24 +238,108 @@ class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
         Returns:
             Result of request as appearance object
         """
-        if (
-            not 1 <= appearance.ectomorph <= 7
-            or not 1 <= appearance.endomorph <= 7
-            or not 1 <= appearance.mesomorph <= 7
-        ):
-            return AppearanceSomatotypeOut(
-                **appearance.dict(), errors="Scale range not between 1 and 7"
-            )
-        get_response = self.get_single(appearance_id, dataset_id)
-
-        if type(get_response) is NotFoundByIdModel:
-            return get_response
-        if type(get_response) is AppearanceOcclusionOut:
+        if not _somatotype_scale_valid(appearance):
+            return _somatotype_scale_error(appearance)
+        # matching on the 'glasses' discriminator folds the somatotype type check, the
+        # update and the read of the new version into one atomic round trip
+        updated_appearance = self.mongo_api_service.find_one_and_update(
+            appearance_id,
+            appearance,
+            dataset_id,
+            query={"glasses": {"$exists": False}},
+        )
+        if updated_appearance is None:
             return NotFoundByIdModel(id=appearance_id, errors="Node not found.")
+        self._invalidate_request_cache(appearance_id, dataset_id)
+        return AppearanceSomatotypeOut(**updated_appearance)
 
-        self.mongo_api_service.update_document(appearance_id, appearance, dataset_id)
-
-        return self.get_single(appearance_id, dataset_id)
+    def _appearances_with_states_pipeline(self, query: dict):
+        """
+        Build aggregation pipeline resolving appearances together with their participant
+        states in a single database call. Participant states are embedded in participant
+        documents and keep appearance ids as plain strings, so the lookup matches the
+        stringified appearance id against embedded 'appearance_ids' and flattens the
+        matching states afterwards.
+        """
+        self.mongo_api_service._fix_input_ids(query)
+        return [
+            {"$match": query},
+            {
+                "$lookup": {
+                    "from": Collections.PARTICIPANT.value,
+                    "let": {"appearance_id": {"$toString": "$_id"}},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {
+                                    "$in": [
+                                        "$$appearance_id",
+                                        {
+                                            "$reduce": {
+                                                "input": {
+                                                    "$ifNull": [
+                                                        "$participant_states",
+                                                        [],
+                                                    ]
+                                                },
+                                                "initialValue": [],
+                                                "in": {
+                                                    "$concatArrays": [
+                                                        "$$value",
+                                                        {
+                                                            "$ifNull": [
+                                                                "$$this.appearance_ids",
+                                                                [],
+                                                            ]
+                                                        },
+                                                    ]
+                                                },
+                                            }
+                                        },
+                                    ]
+                                }
+                            }
+                        },
+                        {
+                            "$project": {
+                                "_id": 0,
+                                "participant_states": {
+                                    "$filter": {
+                                        "input": "$participant_states",
+                                        "as": "state",
+                                        "cond": {
+                                            "$in": [
+                                                "$$appearance_id",
+                                                {
+                                                    "$ifNull": [
+                                                        "$$state.appearance_ids",
+                                                        [],
+                                                    ]
+                                                },
+                                            ]
+                                        },
+                                    }
+                                },
+                            }
+                        },
+                    ],
+                    "as": "participants_with_states",
+                }
+            },
+            {
+                "$addFields": {
+                    "id": "$_id",
+                    "participant_states": {
+                        "$reduce": {
+                            "input": "$participants_with_states.participant_states",
+                            "initialValue": [],
+                            "in": {"$concatArrays": ["$$value", "$$this"]},
+                        }
+                    },
+                }
+            },
+            {"$project": {"_id": 0, "participants_with_states": 0}},
+        ]
 
     def _add_related_documents(
         self,
@@ -198,14 +351,64 @@ class AppearanceServiceMongoDB(AppearanceService, GenericMongoServiceMixin):
         if depth > 0:
             self._add_participant_states(appearance, dataset_id, depth, source)
 
+    def _add_related_documents_bulk(
+        self, appearances: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add participant states to many appearances with a single query instead of one
+        query per appearance. Appearance ids are kept in participant states as plain
+        strings, so the '$in' values are not converted to ObjectId.
+        """
+        if depth <= 0 or source == _PARTICIPANT_STATE or not appearances:
+            return
+
+        self.mongo_api_service.ensure_index(
+            _PARTICIPANT,
+            self.PARTICIPANT_STATE_APPEARANCE_IDS_INDEX,
+            dataset_id,
+        )
+        appearance_ids = [appearance["id"] for appearance in appearances]
+        participant_states = self.participant_state_service.get_multiple(
+            dataset_id,
+            {"appearance_ids": {"$in": appearance_ids}},
+            depth=depth - 1,
+            source=_APPEARANCE,
+        )
+        states_by_appearance_id = {
+            str(appearance_id): [] for appearance_id in appearance_ids
+        }
+        for participant_state in participant_states:
+            for appearance_id in participant_state.get("appearance_ids") or []:
+                states = states_by_appearance_id.get(str(appearance_id))
+                if states is not None:
+                    states.append(participant_state)
+        for appearance in appearances:
+            appearance["participant_states"] = states_by_appearance_id[
+                str(appearance["id"])
+            ]
+
     def _add_participant_states(self, appearance: dict, dataset_id: Union[int, str], depth: int, source: str):
-        if source != Collections.PARTICIPANT_STATE:
-            query = {"appearance_ids": appearance["id"]}
-            appearance[
-                "participant_states"
-            ] = self.participant_state_service.get_multiple(
-                dataset_id,
-                query,
-                depth=depth - 1,
-                source=Collections.APPEARANCE,
+        if source != _PARTICIPANT_STATE:
+            cache_key = (
+                "appearance_participant_states",
+                str(dataset_id),
+                str(appearance["id"]),
+                depth,
+                source,
             )
+            participant_states = get_cached(cache_key)
+            if participant_states is None:
+                self.mongo_api_service.ensure_index(
+                    _PARTICIPANT,
+                    self.PARTICIPANT_STATE_APPEARANCE_IDS_INDEX,
+                    dataset_id,
+                )
+                query = {"appearance_ids": appearance["id"]}
+                participant_states = self.participant_state_service.get_multiple(
+                    dataset_id,
+                    query,
+                    depth=depth - 1,
+                    source=_APPEARANCE,
+                )
+                set_cached(cache_key, participant_states)
+            appearance["participant_states"] = participant_states
@@ -1,5 +1,7 @@
 from typing import Union
 
+import pymongo
+
 from grisera import ActivityExecutionService
 from grisera import ArrangementService
 from grisera import (
@@ -10,6 +12,17 @@ from grisera import (
 )
 from mongo_service.service_mixins import GenericMongoServiceMixin
 from mongo_service.collection_mapping import Collections
+from mongo_service.mongodb_api_config import mongo_list_batch_size
+
+# collection sentinels used in the traversal hot paths, bound once at module load to
+# avoid repeated enum attribute lookups
+_ACTIVITY = Collections.ACTIVITY
+_ACTIVITY_EXECUTION = Collections.ACTIVITY_EXECUTION
+_ARRANGEMENT = Collections.ARRANGEMENT
+
+# computed once at module load; list endpoint hydrates BasicArrangementOut models, so
+# only their fields are fetched from mongo
+_ARRANGEMENT_LIST_PROJECTION = {field: 1 for field in BasicArrangementOut.__fields__}
 
 
 class ArrangementServiceMongoDB(ArrangementService, GenericMongoServiceMixin):
@@ -17,9 +30,16 @@ class ArrangementServiceMongoDB(ArrangementService, GenericMongoServiceMixin):
     Object to handle logic of arrangement requests
     """
 
+    # index on the embedded foreign key queried by the activity-execution traversal,
+    # so the lookups scan the index instead of the whole activities collection
+    ACTIVITY_EXECUTION_ARRANGEMENT_ID_INDEX = [
+        (f"{Collections.ACTIVITY_EXECUTION}.arrangement_id", pymongo.ASCENDING)
+    ]
+
+    model_out_class = ArrangementOut
+
     def __init__(self):
         super().__init__()
-        self.model_out_class = ArrangementOut
         self.activity_execution_service: ActivityExecutionService = None
 
     def save_arrangement(self, arrangement: ArrangementIn, dataset_id: Union[int, str]):
@@ -35,18 +55,31 @@ class ArrangementServiceMongoDB(ArrangementService, GenericMongoServiceMixin):
         """
         return self.create(arrangement, dataset_id)
 
-    def get_arrangements(self, dataset_id: Union[int, str]):
+    def get_arrangements(self, dataset_id: Union[int, str], depth: int = 0):
         """
         Send request to mongo api to get all arrangements
 
         Args:
             dataset_id (int | str): name of dataset
+            depth: (int): specifies how many related entities will be traversed to create the response
         Returns:
             Result of request as list of arrangement objects
         """
-        arrangements_dict = self.get_multiple(dataset_id)
+        if depth > 0:
+            arrangements_dict = self.mongo_api_service.aggregate(
+                Collections.ARRANGEMENT,
+                self._arrangements_with_executions_pipeline(),
+                dataset_id,
+            )
+        else:
+            arrangements_dict = self.get_multiple(
+                dataset_id,
+                projection=_ARRANGEMENT_LIST_PROJECTION,
+                batch_size=mongo_list_batch_size,
+            )
+        # stored documents already match the schema; construct skips re-validation
         arrangements = [
-            BasicArrangementOut(**arrangement_dict)
+            BasicArrangementOut.construct(**arrangement_dict)
             for arrangement_dict in arrangements_dict
         ]
         return ArrangementsOut(arrangements=arrangements)
@@ -74,13 +107,119 @@ class ArrangementServiceMongoDB(ArrangementService, GenericMongoServiceMixin):
     def update_arrangement(self, arrangement_id: int, arrangement: ArrangementIn, dataset_id: Union[int, str]):
         return self.update(arrangement_id, arrangement, dataset_id)
 
+    @staticmethod
+    def _arrangements_with_executions_pipeline():
+        """
+        Build aggregation pipeline resolving arrangements together with their activity
+        executions in a single database call. Activity executions are embedded in
+        activity documents, so the lookup matches activities containing an execution
+        with given arrangement id and flattens the matching executions afterwards.
+        """
+        return [
+            {
+                "$lookup": {
+                    "from": Collections.ACTIVITY.value,
+                    "let": {"arrangement_id": "$_id"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {
+                                    "$in": [
+                                        "$$arrangement_id",
+                                        {
+                                            "$ifNull": [
+                                                f"${Collections.ACTIVITY_EXECUTION.value}.arrangement_id",
+                                                [],
+                                            ]
+                                        },
+                                    ]
+                                }
+                            }
+                        },
+                        {
+                            "$project": {
+                                "_id": 0,
+                                Collections.ACTIVITY_EXECUTION.value: {
+                                    "$filter": {
+                                        "input": f"${Collections.ACTIVITY_EXECUTION.value}",
+                                        "as": "execution",
+                                        "cond": {
+                                            "$eq": [
+                                                "$$execution.arrangement_id",
+                                                "$$arrangement_id",
+                                            ]
+                                        },
+                                    }
+                                },
+                            }
+                        },
+                    ],
+                    "as": "activities_with_executions",
+                }
+            },
+            {
+                "$addFields": {
+                    "id": "$_id",
+                    Collections.ACTIVITY_EXECUTION.value: {
+                        "$reduce": {
+                            "input": f"$activities_with_executions.{Collections.ACTIVITY_EXECUTION.value}",
+                            "initialValue": [],
+                            "in": {"$concatArrays": ["$$value", "$$this"]},
+                        }
+                    },
+                }
+            },
+            {"$project": {"_id": 0, "activities_with_executions": 0}},
+        ]
+
     def _add_related_documents(self, arrangement: dict, dataset_id: Union[int, str], depth: int, source: str):
-        if source != Collections.ACTIVITY_EXECUTION and depth > 0:
+        if source != _ACTIVITY_EXECUTION and depth > 0:
+            self.mongo_api_service.ensure_index(
+                _ACTIVITY,
+                self.ACTIVITY_EXECUTION_ARRANGEMENT_ID_INDEX,
+                dataset_id,
+            )
             arrangement[
                 "activity_executions"
             ] = self.activity_execution_service.get_multiple(
                 dataset_id,
                 {"arrangement_id": arrangement["id"]},
                 depth=depth - 1,
-                source=Collections.ARRANGEMENT,
+                source=_ARRANGEMENT,
+            )
+
+    def _add_related_documents_bulk(
+        self, arrangements: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add activity executions to many arrangements with a single query instead of one
+        query per arrangement.
+        """
+        if source == _ACTIVITY_EXECUTION or depth <= 0 or not arrangements:
+            return
+
+        self.mongo_api_service.ensure_index(
+            _ACTIVITY,
+            self.ACTIVITY_EXECUTION_ARRANGEMENT_ID_INDEX,
+            dataset_id,
+        )
+        arrangement_ids = [arrangement["id"] for arrangement in arrangements]
+        activity_executions = self.activity_execution_service.get_multiple(
+            dataset_id,
+            {"arrangement_id": self.mongo_api_service.get_id_in_query(arrangement_ids)},
+            depth=depth - 1,
+            source=_ARRANGEMENT,
+        )
+        executions_by_arrangement_id = {
+            str(arrangement_id): [] for arrangement_id in arrangement_ids
+        }
+        for activity_execution in activity_executions:
+            executions = executions_by_arrangement_id.get(
+                str(activity_execution["arrangement_id"])
             )
+            if executions is not None:
+                executions.append(activity_execution)
+        for arrangement in arrangements:
+            arrangement["activity_executions"] = executions_by_arrangement_id[
+                str(arrangement["id"])
+            ]
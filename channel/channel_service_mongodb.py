@@ -1,9 +1,22 @@
 from typing import Union, Type
+
+import pymongo
+
 from grisera import ChannelService
 from grisera import ChannelIn, ChannelOut, ChannelsOut, BasicChannelOut
 from mongo_service.collection_mapping import Collections
+from mongo_service.mongodb_api_config import mongo_list_batch_size
 from mongo_service.service_mixins import GenericMongoServiceMixin
 
+# collection sentinels used in the traversal hot paths, bound once at module load to
+# avoid repeated enum attribute lookups
+_CHANNEL = Collections.CHANNEL
+_REGISTERED_CHANNEL = Collections.REGISTERED_CHANNEL
+
+# computed once at module load; list endpoint hydrates BasicChannelOut models, so only
+# their fields are fetched from mongo
+_CHANNEL_LIST_PROJECTION = {field: 1 for field in BasicChannelOut.__fields__}
+
 
 class ChannelServiceMongoDB(ChannelService, GenericMongoServiceMixin):
     """
@@ -14,9 +27,14 @@ class ChannelServiceMongoDB(ChannelService, GenericMongoServiceMixin):
     model_out_class (Type[BaseModel]): Out class of the model, used by GenericMongoServiceMixin
     """
 
+    # index on the foreign key queried by the registered-channel traversal, so the
+    # lookups scan the index instead of the whole registered channels collection
+    REGISTERED_CHANNEL_CHANNEL_ID_INDEX = [("channel_id", pymongo.ASCENDING)]
+
+    model_out_class = ChannelOut
+
     def __init__(self):
         super().__init__()
-        self.model_out_class = ChannelOut
         self.registered_channel_service = None
 
     def save_channel(self, channel: ChannelIn, dataset_id: Union[int, str]):
@@ -32,17 +50,30 @@ class ChannelServiceMongoDB(ChannelService, GenericMongoServiceMixin):
         """
         return self.create(channel, dataset_id)
 
-    def get_channels(self, dataset_id: Union[int, str]):
+    def get_channels(self, dataset_id: Union[int, str], depth: int = 0):
         """
         Send request to mongo api to get all channels. This method uses mixin get implementation.
 
         Args:
             dataset_id (int | str): name of dataset
+            depth (int): this attribute specifies how many models will be traversed to create the response.
         Returns:
             Result of request as ChannelsOut object
         """
-        results_dict = self.get_multiple(dataset_id)
-        results = [BasicChannelOut(**result) for result in results_dict]
+        if depth > 0:
+            results_dict = self.mongo_api_service.aggregate(
+                Collections.CHANNEL,
+                self._channels_with_registered_channels_pipeline(),
+                dataset_id,
+            )
+        else:
+            results_dict = self.get_multiple(
+                dataset_id,
+                projection=_CHANNEL_LIST_PROJECTION,
+                batch_size=mongo_list_batch_size,
+            )
+        # construct skips re-validating documents fetched from mongo
+        results = [BasicChannelOut.construct(**result) for result in results_dict]
         return ChannelsOut(channels=results)
 
     def get_channel(
@@ -63,13 +94,80 @@ class ChannelServiceMongoDB(ChannelService, GenericMongoServiceMixin):
     """
         return self.get_single(channel_id, dataset_id, depth, source)
 
+    @staticmethod
+    def _channels_with_registered_channels_pipeline():
+        """
+        Build aggregation pipeline resolving channels together with their registered
+        channels in a single database call instead of fetching them in two client trips.
+        """
+        return [
+            {
+                "$lookup": {
+                    "from": Collections.REGISTERED_CHANNEL.value,
+                    "localField": "_id",
+                    "foreignField": "channel_id",
+                    "as": "registered_channels",
+                }
+            },
+            {
+                "$addFields": {
+                    "id": "$_id",
+                    "registered_channels": {
+                        "$map": {
+                            "input": "$registered_channels",
+                            "as": "registered_channel",
+                            "in": {
+                                "$mergeObjects": [
+                                    "$$registered_channel",
+                                    {"id": "$$registered_channel._id"},
+                                ]
+                            },
+                        }
+                    },
+                }
+            },
+            {"$project": {"_id": 0, "registered_channels._id": 0}},
+        ]
+
     def _add_related_documents(self, channel: dict, dataset_id: Union[int, str], depth: int, source: str):
-        if source != Collections.REGISTERED_CHANNEL and depth > 0:
+        if source != _REGISTERED_CHANNEL and depth > 0:
+            self.mongo_api_service.ensure_index(
+                _REGISTERED_CHANNEL,
+                self.REGISTERED_CHANNEL_CHANNEL_ID_INDEX,
+                dataset_id,
+            )
             channel[
                 "registered_channels"
             ] = self.registered_channel_service.get_multiple(
                 dataset_id,
                 {"channel_id": channel["id"]},
                 depth=depth - 1,
-                source=Collections.CHANNEL,
+                source=_CHANNEL,
             )
+
+    def _add_related_documents_bulk(
+        self, channels: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add registered channels to many channels with a single query instead of one
+        query per channel.
+        """
+        if source == _REGISTERED_CHANNEL or depth <= 0 or not channels:
+            return
+
+        self.mongo_api_service.ensure_index(
+            _REGISTERED_CHANNEL,
+            self.REGISTERED_CHANNEL_CHANNEL_ID_INDEX,
+            dataset_id,
+        )
+        registered_by_channel_id = self.registered_channel_service.get_grouped_by_parent_id(
+            "channel_id",
+            [channel["id"] for channel in channels],
+            dataset_id,
+            depth=depth - 1,
+            source=_CHANNEL,
+        )
+        for channel in channels:
+            channel["registered_channels"] = registered_by_channel_id[
+                str(channel["id"])
+            ]
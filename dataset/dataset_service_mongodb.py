@@ -5,29 +5,48 @@ from grisera import DatasetOut, DatasetIn
 
 
 from mongo_service import MongoApiService
+from mongo_service.collection_mapping import Collections
 from mongo_service.service_mixins import GenericMongoServiceMixin
 from mongo_service.mongodb_api_config import mongo_database_name
 
+# computed once at module load; list endpoint hydrates BasicDatasetOut models, so only
+# their fields are projected server-side, with mongo's '_id' renamed to 'id'
+_DATASET_LIST_PROJECTION = {
+    **{field: 1 for field in BasicDatasetOut.__fields__},
+    "id": "$_id",
+    "_id": 0,
+}
+
 
 class DatasetServiceMongoDB(DatasetService, GenericMongoServiceMixin):
     """
     Object to handle logic of datasets requests
     """
 
+    model_out_class = DatasetOut
+
     def __init__(self):
         super().__init__()
         self.mongo_api_service = MongoApiService()
-        self.model_out_class = DatasetOut
 
     def save_dataset(self, dataset: DatasetIn):
         return self.create(dataset, mongo_database_name)
 
     def get_datasets(self, dataset_ids: List[Union[int, str]]):
-        results_dict = self.get_multiple(mongo_database_name, query={
-            "_id": self.mongo_api_service.get_id_in_query(dataset_ids)
-        })
-        results = [BasicDatasetOut(**result) for result in results_dict]
-        return DatasetsOut(datasets=results)
+        # single aggregation returns already-projected documents; at most
+        # len(dataset_ids) can match, so a batch of that size arrives in one reply
+        pipeline = [
+            {"$match": {"_id": self.mongo_api_service.get_id_in_query(dataset_ids)}},
+            {"$project": _DATASET_LIST_PROJECTION},
+        ]
+        results_dict = self.mongo_api_service.aggregate(
+            Collections.DATASET,
+            pipeline,
+            mongo_database_name,
+            batchSize=len(dataset_ids),
+        )
+        results = [BasicDatasetOut.construct(**result) for result in results_dict]
+        return DatasetsOut.construct(datasets=results)
 
     def get_dataset(self, dataset_id: Union[int, str]):
         return self.get_single(dataset_id, mongo_database_name)
@@ -9,20 +9,34 @@ from grisera import (
 from grisera import ExperimentService
 from grisera import NotFoundByIdModel
 from mongo_service.collection_mapping import Collections
+from mongo_service.model_factories import specialized_constructor
 from mongo_service.mongo_api_service import MongoApiService
+from mongo_service.mongodb_api_config import mongo_list_batch_size
 from mongo_service.service_mixins import GenericMongoServiceMixin
 from grisera import ScenarioService
 
+# computed once at module load; list endpoint hydrates BasicExperimentOut models, so
+# only their fields are fetched from mongo
+_EXPERIMENT_LIST_PROJECTION = {field: 1 for field in BasicExperimentOut.__fields__}
+
+# per-class construct specialization, built once instead of per row
+_construct_basic_experiment = specialized_constructor(BasicExperimentOut)
+
+# sources at which experiment traversal stops, checked with a single set membership in
+# the traversal hot path instead of chained comparisons
+_STOP_SOURCES = frozenset((Collections.ACTIVITY_EXECUTION, Collections.EXPERIMENT))
+
 
 class ExperimentServiceMongoDB(ExperimentService, GenericMongoServiceMixin):
     """
     Object to handle logic of experiments requests
     """
 
+    model_out_class = ExperimentOut
+
     def __init__(self):
         super().__init__()
         self.mongo_api_service = MongoApiService()
-        self.model_out_class = ExperimentOut
         self.scenario_service: ScenarioService = None
 
     def save_experiment(self, experiment: ExperimentIn, dataset_id: Union[int, str]):
@@ -49,10 +63,33 @@ class ExperimentServiceMongoDB(ExperimentService, GenericMongoServiceMixin):
         Returns:
             Result of request as list of experiments objects
         """
-        results_dict = self.get_multiple(dataset_id, query)
-        experiments = [BasicExperimentOut(**result) for result in results_dict]
+        results_dict = self.get_multiple(
+            dataset_id,
+            query,
+            projection=_EXPERIMENT_LIST_PROJECTION,
+            batch_size=mongo_list_batch_size,
+        )
+        # results are trusted server state, so validation is skipped on read
+        experiments = [_construct_basic_experiment(result) for result in results_dict]
         return ExperimentsOut(experiments=experiments)
 
+    def iter_experiments(self, dataset_id: Union[int, str]):
+        """
+        Iterate over all experiments as dicts, streamed from the cursor in batches
+        instead of materialized as one list. Used by the streaming list endpoint.
+
+        Args:
+            dataset_id (int | str): name of dataset
+
+        Yields:
+            Experiments as dictionaries
+        """
+        return self.iter_multiple(
+            dataset_id,
+            projection=_EXPERIMENT_LIST_PROJECTION,
+            batch_size=mongo_list_batch_size,
+        )
+
     def get_experiment(
         self, experiment_id: Union[int, str], dataset_id: Union[int, str], depth: int = 0, source: str = ""
     ):
@@ -98,7 +135,7 @@ class ExperimentServiceMongoDB(ExperimentService, GenericMongoServiceMixin):
         return self.update(experiment_id, experiment, dataset_id)
 
     def _add_related_documents(self, experiment: dict, dataset_id: Union[int, str], depth: int, source: str):
-        if depth <= 0 or source == Collections.ACTIVITY_EXECUTION or source == Collections.EXPERIMENT:
+        if depth <= 0 or source in _STOP_SOURCES:
             return
         source = source if source != "" else Collections.EXPERIMENT
 
@@ -112,3 +149,27 @@ class ExperimentServiceMongoDB(ExperimentService, GenericMongoServiceMixin):
             return
 
         experiment["scenarios"] = related_scenario
+
+    def _add_related_documents_bulk(
+        self, experiments: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add scenarios to many experiments with a single query instead of one query
+        per experiment.
+        """
+        if depth <= 0 or source in _STOP_SOURCES or not experiments:
+            return
+        source = source if source != "" else Collections.EXPERIMENT
+
+        scenarios_by_experiment = self.scenario_service.get_scenarios_by_experiment_ids(
+            [experiment["id"] for experiment in experiments],
+            dataset_id,
+            depth=depth,
+            source=source,
+        )
+        for experiment in experiments:
+            related_scenarios = scenarios_by_experiment[str(experiment["id"])]
+            # single-experiment traversal leaves the field absent when no scenario
+            # references the experiment; mirror that here
+            if related_scenarios:
+                experiment["scenarios"] = related_scenarios
@@ -1,3 +1,4 @@
+import operator
 from unittest import TestCase
 
 import mongomock
@@ -49,8 +50,8 @@ class TestMongoLifeActivity(TestCase):
             created_la.append(life_activity_service.save_life_activity(life_activity))
         result = life_activity_service.get_life_activities()
         self.assertEqual(len(result.life_activities), created_la_count)
-        created_la_ids = set(la.id for la in created_la)
-        fetched_la_ids = set(la.id for la in result.life_activities)
+        created_la_ids = set(map(operator.attrgetter("id"), created_la))
+        fetched_la_ids = set(map(operator.attrgetter("id"), result.life_activities))
         self.assertSetEqual(created_la_ids, fetched_la_ids)
 
     @mongomock.patch(servers=((mongo_api_host, mongo_api_port),))
@@ -80,8 +81,8 @@ class TestMongoLifeActivity(TestCase):
         result = life_activity_service.get_life_activity(created_life_activity.id, depth=1)
         self.assertFalse(type(result) is NotFoundByIdModel)
         self.assertEqual(len(result.observable_informations), created_oi_count)
-        expected_created_ids = set(oi.id for oi in created_oi)
-        created_ids = set(oi.id for oi in result.observable_informations)
+        expected_created_ids = set(map(operator.attrgetter("id"), created_oi))
+        created_ids = set(map(operator.attrgetter("id"), result.observable_informations))
         self.assertSetEqual(expected_created_ids, created_ids)
         # check whether too much models weren't fetched
         self.assertIsNone(result.observable_informations[0].recording)
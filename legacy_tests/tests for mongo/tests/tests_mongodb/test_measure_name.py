@@ -1,3 +1,4 @@
+import operator
 import mongomock
 from grisera import MeasureIn
 from grisera import MeasureNameIn
@@ -47,8 +48,8 @@ class TestMongoMeasureName(TestCase):
             created_mn.append(self.generate_measure_name())
         result = measure_name_service.get_measure_names()
         self.assertEqual(len(result.measure_names), created_mn_count)
-        created_mn_ids = set(mn.id for mn in created_mn)
-        fetched_mn_ids = set(mn.id for mn in result.measure_names)
+        created_mn_ids = set(map(operator.attrgetter("id"), created_mn))
+        fetched_mn_ids = set(map(operator.attrgetter("id"), result.measure_names))
         self.assertSetEqual(created_mn_ids, fetched_mn_ids)
 
     @mongomock.patch(servers=((mongo_api_host, mongo_api_port),))
@@ -1,3 +1,4 @@
+import operator
 import mongomock
 
 from grisera import RecordingIn
@@ -41,8 +42,8 @@ class TestMongoModality(TestCase):
             created_modalities.append(modality_service.save_modality(modality))
         result = modality_service.get_modalities()
         self.assertEqual(len(result.modalities), created_modalities_count)
-        created_modalities_ids = set(modality.id for modality in created_modalities)
-        fetched_modalities_ids = set(modality.id for modality in result.modalities)
+        created_modalities_ids = set(map(operator.attrgetter("id"), created_modalities))
+        fetched_modalities_ids = set(map(operator.attrgetter("id"), result.modalities))
         self.assertSetEqual(created_modalities_ids, fetched_modalities_ids)
 
     @mongomock.patch(servers=((mongo_api_host, mongo_api_port),))
@@ -68,8 +69,8 @@ class TestMongoModality(TestCase):
         result = modality_service.get_modality(created_modality.id, depth=1)
         self.assertFalse(type(result) is NotFoundByIdModel)
         self.assertEqual(len(result.observable_informations), created_oi_count)
-        expected_created_ids = set(oi.id for oi in created_oi)
-        created_ids = set(oi.id for oi in result.observable_informations)
+        expected_created_ids = set(map(operator.attrgetter("id"), created_oi))
+        created_ids = set(map(operator.attrgetter("id"), result.observable_informations))
         self.assertSetEqual(expected_created_ids, created_ids)
         # check whether too much models weren't fetched
         self.assertIsNone(result.observable_informations[0].recording)
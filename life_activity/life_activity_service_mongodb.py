@@ -8,11 +8,25 @@ from grisera import (
 )
 from grisera import LifeActivityService
 from mongo_service.collection_mapping import Collections
+from mongo_service.model_factories import specialized_constructor
+from mongo_service.mongodb_api_config import mongo_list_batch_size
 from mongo_service.service_mixins import GenericMongoServiceMixin
 from grisera import (
     ObservableInformationService,
 )
 
+# collection sentinels used in the traversal hot paths, bound once at module load to
+# avoid repeated enum attribute lookups
+_LIFE_ACTIVITY = Collections.LIFE_ACTIVITY
+_OBSERVABLE_INFORMATION = Collections.OBSERVABLE_INFORMATION
+
+# computed once at module load; list endpoint hydrates BasicLifeActivityOut models, so
+# only their fields are fetched from mongo
+_LIFE_ACTIVITY_LIST_PROJECTION = {field: 1 for field in BasicLifeActivityOut.__fields__}
+
+# per-class construct specialization, built once instead of per row
+_construct_basic_life_activity = specialized_constructor(BasicLifeActivityOut)
+
 
 class LifeActivityServiceMongoDB(LifeActivityService, GenericMongoServiceMixin):
     """
@@ -51,8 +65,13 @@ class LifeActivityServiceMongoDB(LifeActivityService, GenericMongoServiceMixin):
         Returns:
             Result of request as list of life activity objects
         """
-        result_dict = self.get_multiple(dataset_id=dataset_id)
-        results = [BasicLifeActivityOut(**result) for result in result_dict]
+        result_dict = self.get_multiple(
+            dataset_id=dataset_id,
+            projection=_LIFE_ACTIVITY_LIST_PROJECTION,
+            batch_size=mongo_list_batch_size,
+        )
+        # construct skips re-validating documents fetched from mongo
+        results = [_construct_basic_life_activity(result) for result in result_dict]
         return LifeActivitiesOut(life_activities=results)
 
     def get_life_activity(
@@ -73,12 +92,35 @@ class LifeActivityServiceMongoDB(LifeActivityService, GenericMongoServiceMixin):
         return self.get_single(life_activity_id, dataset_id, depth, source)
 
     def _add_related_documents(self, life_activity: dict, dataset_id: Union[int, str], depth: int, source: str):
-        if source != Collections.OBSERVABLE_INFORMATION and depth > 0:
+        if source != _OBSERVABLE_INFORMATION and depth > 0:
             life_activity[
                 "observable_informations"
             ] = self.observable_information_service.get_multiple(
                 dataset_id,
                 {"life_activity_id": life_activity["id"]},
                 depth=depth - 1,
-                source=Collections.LIFE_ACTIVITY,
+                source=_LIFE_ACTIVITY,
+            )
+
+    def _add_related_documents_bulk(
+        self, life_activities: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add observable informations to many life activities with a single query
+        instead of one query per life activity.
+        """
+        if source == _OBSERVABLE_INFORMATION or depth <= 0 or not life_activities:
+            return
+
+        observable_informations_by_id = (
+            self.observable_information_service.get_multiple_by_life_activity_ids(
+                [life_activity["id"] for life_activity in life_activities],
+                dataset_id,
+                depth=depth - 1,
+                source=_LIFE_ACTIVITY,
             )
+        )
+        for life_activity in life_activities:
+            life_activity["observable_informations"] = observable_informations_by_id[
+                str(life_activity["id"])
+            ]
@@ -5,6 +5,7 @@ from grisera import appearance_router
 from grisera import experiment_router
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from grisera import get_links
 from grisera import life_activity_router
 from grisera import measure_router
@@ -16,7 +17,17 @@ from grisera import participation_router
 from grisera import personality_router
 from grisera import recording_router
 from grisera import registered_channel_router
+from asyncio import to_thread
+from typing import Union
+
+import orjson
+import pymongo.errors
 from grisera import abstract_service as service
+from mongo_service import MongoApiService
+from mongo_service.request_cache import (
+    activate_request_cache,
+    deactivate_request_cache,
+)
 from services.mongo_service import service as mongo_service
 from grisera import time_series_router
 from grisera import registered_data_router
@@ -31,6 +42,8 @@ app = FastAPI(
                 "framework provides a persistent model for storing integrated signals and methods for its "
                 "creation.",
     version="0.1",
+    # orjson serializes large list responses several times faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -42,6 +55,44 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type"],  # Allow specific headers including Authorization ["Authorization", "Content-Type"]
 )
 
+@app.middleware("http")
+async def request_cache_middleware(request, call_next):
+    """
+    Activate the request-scoped document cache for the duration of each request, so
+    services do not repeat identical single document fetches.
+    """
+    token = activate_request_cache()
+    try:
+        return await call_next(request)
+    finally:
+        deactivate_request_cache(token)
+
+
+# registered before the experiment router, otherwise /experiments/stream would be
+# captured by its /experiments/{experiment_id} route
+@app.get("/experiments/stream", tags=["experiments"])
+def stream_experiments(dataset_id: Union[int, str]):
+    """
+    Stream all experiments as one json document without building the whole response in
+    memory; peak memory stays bounded by the cursor batch size. Intended for large
+    datasets, the regular experiments endpoint remains for small payloads.
+    """
+    experiment_service = _service_factory.get_experiment_service()
+
+    def generate():
+        yield b'{"experiments":['
+        first = True
+        for experiment in experiment_service.iter_experiments(dataset_id):
+            if first:
+                first = False
+            else:
+                yield b","
+            yield orjson.dumps(experiment)
+        yield b"]}"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
 app.include_router(activity_router)
 app.include_router(activity_execution_router)
 app.include_router(appearance_router)
@@ -64,15 +115,47 @@ app.include_router(scenario_router)
 app.include_router(time_series_router)
 app.include_router(dataset_router)
 
-app.dependency_overrides[service.get_service_factory] = mongo_service.get_service_factory
+# resolve the factory singleton once at import; the override then returns the
+# prebuilt instance instead of going through the MongoService method on every
+# dependency injection
+_service_factory = mongo_service.get_service_factory()
+app.dependency_overrides[service.get_service_factory] = lambda: _service_factory
 
 
 
+@app.on_event("startup")
+async def warm_mongo_pool():
+    """
+    Prime the shared connection pool, so the first user request does not pay the TCP
+    and handshake latency. Best effort: when mongo is not reachable yet, the app still
+    starts and requests fail individually as before.
+    """
+    try:
+        await to_thread(MongoApiService().client.admin.command, "ping")
+    except pymongo.errors.PyMongoError:
+        pass
+
+
+@app.on_event("shutdown")
+async def close_mongo_pool():
+    """
+    Close the shared connection pool cleanly on shutdown.
+    """
+    MongoApiService().client.close()
+
+
+@app.on_event("startup")
+async def cache_links():
+    """
+    Precompute api links once; get_links walks all registered routers, and its result
+    only depends on the app, so there is no need to rebuild it per request.
+    """
+    app.state.links = get_links(app)
+
+
 @app.get("/", tags=["root"])
 async def root():
     """
     Return home page of api
     """
-    response = {"title": "GRISERA API"}
-    response.update({"links": get_links(app)})
-    return response
+    return {"title": "GRISERA API", "links": app.state.links}
@@ -1,13 +1,9 @@
 #!/usr/bin/python3
-import unittest
 import sys
 
 if 'test' in sys.argv:
-    loader = unittest.TestLoader()
-    tests_dir = 'tests'
-    tests = loader.discover(tests_dir)
+    import pytest
 
-    runner = unittest.TextTestRunner()
-    success = runner.run(tests).wasSuccessful()
-
-    exit(0 if success else 1)
+    # -n auto spreads test files over all cores; the mongomock-backed tests are
+    # independent and setup-heavy, so they scale with the worker count
+    sys.exit(pytest.main(["-n", "auto", "tests"]))
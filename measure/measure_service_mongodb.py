@@ -1,5 +1,7 @@
 from typing import Union
 
+import pymongo
+
 from grisera import (
     MeasurePropertyIn,
     BasicMeasureOut,
@@ -12,9 +14,14 @@ from grisera import MeasureService
 from grisera import MeasureNameService
 from grisera import NotFoundByIdModel
 from mongo_service.collection_mapping import Collections
+from mongo_service.model_factories import specialized_constructor
 from mongo_service.mongo_api_service import MongoApiService
+from mongo_service.mongodb_api_config import mongo_list_batch_size
 from mongo_service.service_mixins import GenericMongoServiceMixin
 
+# validation-free constructor for documents read back from our own collection
+_construct_basic_measure = specialized_constructor(BasicMeasureOut)
+
 
 class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
     """
@@ -25,6 +32,10 @@ class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
         measure_name_service (MeasureNameService): Service to manage measure name models
     """
 
+    # index on the foreign key queried by the time series traversal, so the lookups
+    # scan the index instead of the whole time series collection
+    TIME_SERIES_MEASURE_ID_INDEX = [("measure_id", pymongo.ASCENDING)]
+
     def __init__(self):
         super().__init__()
         self.mongo_api_service = MongoApiService()
@@ -43,9 +54,11 @@ class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
         Returns:
             Result of request as measure object
         """
-        related_mn = self.measure_name_service.get_measure_name(measure.measure_name_id, dataset_id)
-        mn_exists = type(related_mn) is not NotFoundByIdModel
-        if measure.measure_name_id is not None and not mn_exists:
+        # existence probe matches only the id server side instead of fetching and
+        # deserializing the whole referenced document
+        if measure.measure_name_id is not None and not self.measure_name_service.exists(
+            measure.measure_name_id, dataset_id
+        ):
             return MeasureOut(errors={"errors": "given measure name does not exist"})
 
         return self.create(measure, dataset_id)
@@ -61,8 +74,13 @@ class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
         Returns:
             Result of request as list of measures objects
         """
-        measures_dict = self.get_multiple(dataset_id, query)
-        results = [BasicMeasureOut(**result) for result in measures_dict]
+        # built in one pass from the cursor, without an intermediate dict list
+        results = [
+            _construct_basic_measure(result)
+            for result in self.iter_multiple(
+                dataset_id, query, batch_size=mongo_list_batch_size
+            )
+        ]
         return MeasuresOut(measures=results)
 
     def get_measure(
@@ -107,16 +125,18 @@ class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
         Returns:
             Result of request as measure object
         """
-        existing_measure = self.get_measure(measure_id, dataset_id)
-        for field, value in measure.dict().items():
-            setattr(existing_measure, field, value)
-
-        self.mongo_api_service.update_document(
-            measure_id,
-            existing_measure,
-            dataset_id,
+        # single atomic $set of the provided fields and read-back of the result,
+        # instead of fetching the document, rewriting it whole and returning the merge
+        updated_measure = self.mongo_api_service.find_one_and_update(
+            measure_id, measure, dataset_id
         )
-        return existing_measure
+        if updated_measure is None:
+            return NotFoundByIdModel(
+                id=measure_id,
+                errors={"errors": "measure not found"},
+            )
+        self._invalidate_request_cache(measure_id, dataset_id)
+        return MeasureOut(**updated_measure)
 
     def update_measure_relationships(
         self, measure_id: Union[int, str], measure: MeasureRelationIn, dataset_id: Union[int, str]
@@ -132,31 +152,77 @@ class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
         Returns:
             Result of request as measure object
         """
-        existing_measure = self.get_measure(measure_id, dataset_id)
-
-
-
-        if type(existing_measure) is NotFoundByIdModel:
-            return existing_measure
-
+        if measure.measure_name_id is not None and not self.measure_name_service.exists(
+            measure.measure_name_id, dataset_id
+        ):
+            return MeasureOut(errors={"errors": "given measure name does not exist"})
 
+        # single atomic round trip instead of a read, a write and a re-read; returns
+        # None when no measure has the given id
+        updated_measure = self.mongo_api_service.find_one_and_update(
+            measure_id, measure, dataset_id
+        )
+        if updated_measure is None:
+            return NotFoundByIdModel(
+                id=measure_id,
+                errors={"errors": "measure not found"},
+            )
+        self._invalidate_request_cache(measure_id, dataset_id)
+        return MeasureOut(**updated_measure)
 
-        related_mn = self.measure_name_service.get_measure_name(measure.measure_name_id, dataset_id)
-        mn_exists = type(related_mn) is not NotFoundByIdModel
-        if measure.measure_name_id is not None and not mn_exists:
-            return MeasureOut(errors={"errors": "given measure name does not exist"})
 
-        existing_measure_in = MeasureIn(**existing_measure.dict())
+    def bulk_update_measure_relationships(
+        self, updates: list, dataset_id: Union[int, str]
+    ):
+        """
+        Rewire many measures to new measure names with two round trips instead of a
+        read and a write per measure: all referenced measure names are validated with
+        one '$in' query, and the valid updates go out as a single bulk_write. Used for
+        batch migrations and bulk imports.
 
-        existing_measure_in.measure_name_id = measure.measure_name_id
+        Args:
+            updates (list): pairs of measure id and MeasureRelationIn
+            dataset_id (int | str): name of dataset
 
-        self.mongo_api_service.update_document(
-            measure_id,
-            existing_measure_in,
-            dataset_id
+        Returns:
+            Dict with ids of updated measures and per-measure errors for updates whose
+            measure name does not exist
+        """
+        measure_name_ids = {
+            str(measure.measure_name_id)
+            for _, measure in updates
+            if measure.measure_name_id is not None
+        }
+        existing_measure_names = self.mongo_api_service.get_many_by_ids(
+            Collections.MEASURE_NAME,
+            list(measure_name_ids),
+            dataset_id,
+            projection={self.mongo_api_service.MONGO_ID_FIELD: 1},
         )
-        return self.get_measure(measure_id, dataset_id)
 
+        updates_by_id = {}
+        errors = []
+        for measure_id, measure in updates:
+            measure_name_id = measure.measure_name_id
+            if (
+                measure_name_id is not None
+                and str(measure_name_id) not in existing_measure_names
+            ):
+                errors.append(
+                    {
+                        "measure_id": measure_id,
+                        "errors": "given measure name does not exist",
+                    }
+                )
+                continue
+            updates_by_id[str(measure_id)] = measure.dict(exclude_unset=True)
+
+        self.mongo_api_service.bulk_update(
+            Collections.MEASURE, updates_by_id, dataset_id
+        )
+        for measure_id in updates_by_id:
+            self._invalidate_request_cache(measure_id, dataset_id)
+        return {"updated_ids": list(updates_by_id), "errors": errors}
 
     def _add_related_documents(self, measure: dict, dataset_id: Union[int, str], depth: int, source: str):
         if depth > 0:
@@ -165,6 +231,11 @@ class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
 
     def _add_related_time_series(self, measure: dict, dataset_id: Union[int, str], depth: int, source: str):
         if source != Collections.TIME_SERIES:
+            self.mongo_api_service.ensure_index(
+                Collections.TIME_SERIES,
+                self.TIME_SERIES_MEASURE_ID_INDEX,
+                dataset_id,
+            )
             measure["time_series"] = self.time_series_service.get_multiple(
                 dataset_id,
                 {"measure_id": measure["id"]},
@@ -181,3 +252,64 @@ class MeasureServiceMongoDB(MeasureService, GenericMongoServiceMixin):
                 depth=depth - 1,
                 source=Collections.MEASURE,
             )
+
+    def _add_related_documents_bulk(
+        self, measures: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add related documents to many measures, resolving their measure names with a
+        single query instead of one fetch per measure.
+        """
+        if depth <= 0 or not measures:
+            return
+        self._add_related_time_series_bulk(measures, dataset_id, depth, source)
+        self._add_related_measure_names_bulk(measures, dataset_id, depth, source)
+
+    def _add_related_time_series_bulk(
+        self, measures: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        if source == Collections.TIME_SERIES:
+            return
+        self.mongo_api_service.ensure_index(
+            Collections.TIME_SERIES,
+            self.TIME_SERIES_MEASURE_ID_INDEX,
+            dataset_id,
+        )
+        # grouped by hand, as the time series service does not use the generic mixin
+        measure_ids = [measure["id"] for measure in measures]
+        time_series = self.time_series_service.get_multiple(
+            dataset_id,
+            {"measure_id": self.mongo_api_service.get_id_in_query(measure_ids)},
+            depth=depth - 1,
+            source=Collections.MEASURE,
+        )
+        time_series_by_measure = {str(measure_id): [] for measure_id in measure_ids}
+        for single_time_series in time_series:
+            bucket = time_series_by_measure.get(str(single_time_series.get("measure_id")))
+            if bucket is not None:
+                bucket.append(single_time_series)
+        for measure in measures:
+            measure["time_series"] = time_series_by_measure[str(measure["id"])]
+
+    def _add_related_measure_names_bulk(
+        self, measures: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        if source == Collections.MEASURE_NAME:
+            return
+        measure_name_ids = {
+            measure["measure_name_id"]
+            for measure in measures
+            if measure["measure_name_id"] is not None
+        }
+        if not measure_name_ids:
+            return
+        measure_names_by_id = self.measure_name_service.get_many_by_ids(
+            list(measure_name_ids),
+            dataset_id,
+            depth=depth - 1,
+            source=Collections.MEASURE,
+        )
+        for measure in measures:
+            measure_name = measure_names_by_id.get(str(measure["measure_name_id"]))
+            if measure_name is not None:
+                measure["measure_name"] = measure_name
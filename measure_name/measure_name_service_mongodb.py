@@ -1,5 +1,7 @@
 from typing import Union
 
+import pymongo
+
 from grisera import MeasureService
 from grisera import (
     MeasureNameIn,
@@ -9,9 +11,14 @@ from grisera import (
 )
 from grisera import MeasureNameService
 from mongo_service.collection_mapping import Collections
+from mongo_service.model_factories import specialized_constructor
 from mongo_service.mongo_api_service import MongoApiService
+from mongo_service.mongodb_api_config import mongo_list_batch_size
 from mongo_service.service_mixins import GenericMongoServiceMixin
 
+# validation-free constructor for documents read back from our own collection
+_construct_basic_measure_name = specialized_constructor(BasicMeasureNameOut)
+
 
 class MeasureNameServiceMongoDB(MeasureNameService, GenericMongoServiceMixin):
     """
@@ -22,6 +29,10 @@ class MeasureNameServiceMongoDB(MeasureNameService, GenericMongoServiceMixin):
         measure_name_service (MeasureNameService): Service to manage measure name models
     """
 
+    # index on the foreign key queried by the measure traversal, so the lookups scan
+    # the index instead of the whole measures collection
+    MEASURE_MEASURE_NAME_ID_INDEX = [("measure_name_id", pymongo.ASCENDING)]
+
     def __init__(self):
         super().__init__()
         self.mongo_api_service = MongoApiService()
@@ -51,10 +62,39 @@ class MeasureNameServiceMongoDB(MeasureNameService, GenericMongoServiceMixin):
         Returns:
             Result of request as list of measure name objects
         """
-        result_dict = self.get_multiple(dataset_id)
-        results = [BasicMeasureNameOut(**result) for result in result_dict]
+        # built in one pass from the cursor, without an intermediate dict list
+        results = [
+            _construct_basic_measure_name(result)
+            for result in self.iter_multiple(
+                dataset_id, batch_size=mongo_list_batch_size
+            )
+        ]
         return MeasureNamesOut(measure_names=results)
 
+    def get_many_by_ids(
+        self, measure_name_ids: list, dataset_id: Union[int, str], depth: int = 0, source: str = ""
+    ):
+        """
+        Get many measure names with a single query instead of one fetch per id. Used by
+        services resolving the measure name references of a whole result batch.
+
+        Args:
+            measure_name_ids (list): identities of measure names
+            dataset_id (int | str): name of dataset
+            depth: (int): specifies how many related entities will be traversed to create the response
+            source (str): internal argument for mongo services, used to tell the direction of model fetching.
+
+        Returns:
+            Dict mapping each found measure name id to its dict
+        """
+        measure_names_by_id = self.mongo_api_service.get_many_by_ids(
+            Collections.MEASURE_NAME, measure_name_ids, dataset_id
+        )
+        if depth > 0:
+            for measure_name in measure_names_by_id.values():
+                self._add_related_documents(measure_name, dataset_id, depth, source)
+        return measure_names_by_id
+
     def get_measure_name(
         self, measure_name_id: Union[int, str], dataset_id: Union[int, str], depth: int = 0, source: str = ""
     ):
@@ -97,9 +137,38 @@ class MeasureNameServiceMongoDB(MeasureNameService, GenericMongoServiceMixin):
 
     def _add_related_documents(self, measure_name: dict, dataset_id: Union[int, str], depth: int, source: str):
         if source != Collections.MEASURE and depth > 0:
+            self.mongo_api_service.ensure_index(
+                Collections.MEASURE,
+                self.MEASURE_MEASURE_NAME_ID_INDEX,
+                dataset_id,
+            )
             measure_name["measures"] = self.measure_service.get_multiple(
                 dataset_id,
                 {"measure_name_id": measure_name["id"]},
                 depth=depth - 1,
                 source=Collections.MEASURE_NAME,
             )
+
+    def _add_related_documents_bulk(
+        self, measure_names: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add measures to many measure names with a single query instead of one query per
+        measure name.
+        """
+        if source == Collections.MEASURE or depth <= 0 or not measure_names:
+            return
+        self.mongo_api_service.ensure_index(
+            Collections.MEASURE,
+            self.MEASURE_MEASURE_NAME_ID_INDEX,
+            dataset_id,
+        )
+        measures_by_name = self.measure_service.get_grouped_by_parent_id(
+            "measure_name_id",
+            [measure_name["id"] for measure_name in measure_names],
+            dataset_id,
+            depth=depth - 1,
+            source=Collections.MEASURE_NAME,
+        )
+        for measure_name in measure_names:
+            measure_name["measures"] = measures_by_name[str(measure_name["id"])]
@@ -2,6 +2,8 @@ from typing import Union
 
 from mongo_service.service_mixins import GenericMongoServiceMixin
 from mongo_service.collection_mapping import Collections
+from mongo_service.model_factories import specialized_constructor
+from mongo_service.mongodb_api_config import mongo_list_batch_size
 from grisera import (
     ModalityIn,
     ModalityOut,
@@ -13,6 +15,9 @@ from grisera import (
     ObservableInformationService,
 )
 
+# validation-free constructor for documents read back from our own collection
+_construct_basic_modality = specialized_constructor(BasicModalityOut)
+
 
 class ModalityServiceMongoDB(ModalityService, GenericMongoServiceMixin):
     """
@@ -51,8 +56,13 @@ class ModalityServiceMongoDB(ModalityService, GenericMongoServiceMixin):
         Returns:
             Result of request as list of modality objects
         """
-        result_dict = self.get_multiple(dataset_id)
-        results = [BasicModalityOut(**result) for result in result_dict]
+        # built in one pass from the cursor, without an intermediate dict list
+        results = [
+            _construct_basic_modality(result)
+            for result in self.iter_multiple(
+                dataset_id, batch_size=mongo_list_batch_size
+            )
+        ]
         return ModalitiesOut(modalities=results)
 
     def get_modality(
@@ -82,3 +92,21 @@ class ModalityServiceMongoDB(ModalityService, GenericMongoServiceMixin):
                 depth=depth - 1,
                 source=Collections.MODALITY,
             )
+
+    def _add_related_documents_bulk(
+        self, modalities: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Add observable informations to many modalities with a single recording query
+        instead of one query per modality.
+        """
+        if source == Collections.OBSERVABLE_INFORMATION or depth <= 0 or not modalities:
+            return
+        grouped = self.observable_information_service.get_multiple_by_modality_ids(
+            [modality["id"] for modality in modalities],
+            dataset_id,
+            depth=depth - 1,
+            source=Collections.MODALITY,
+        )
+        for modality in modalities:
+            modality["observable_informations"] = grouped[str(modality["id"])]
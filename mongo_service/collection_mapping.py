@@ -47,6 +47,7 @@ from grisera import (
     TimeSeriesRelationIn,
 )
 from enum import Enum
+from types import MappingProxyType
 
 """
 This module provides enum with collection names in mongodb to help avoiding 
@@ -59,6 +60,12 @@ class.
 
 
 class Collections(str, Enum):
+    # since Python 3.11 mixed-in enums format as "Collections.X" instead of their
+    # value, which would corrupt the embedded field paths built with f-strings;
+    # formatting is pinned to the plain string value on every version
+    __str__ = str.__str__
+    __format__ = str.__format__
+
     DATASET = "dataset"
     ACTIVITY = "activities"
     ACTIVITY_EXECUTION = "activity_executions"
@@ -118,12 +125,27 @@ SUPERCLASSES_TO_COLLECTION_NAMES = {
     TimeSeriesRelationIn: Collections.TIME_SERIES,
 }
 
+# read-only view: a mutation after import would silently disagree with the
+# class-to-collection cache below
+SUPERCLASSES_TO_COLLECTION_NAMES = MappingProxyType(SUPERCLASSES_TO_COLLECTION_NAMES)
+
+
+# memoizes resolved classes; get_collection_name runs on every create/update/get, so
+# after the first call per class the superclass scan is replaced by one dict lookup
+_CLASS_TO_COLLECTION_CACHE = {}
+
 
 def get_collection_name(model_class):
     """
     Get mongo collection name, based on the class of model object
     """
-    for superclass, collection_name in SUPERCLASSES_TO_COLLECTION_NAMES.items():
-        if issubclass(model_class, superclass):
+    try:
+        return _CLASS_TO_COLLECTION_CACHE[model_class]
+    except KeyError:
+        pass
+    for superclass in model_class.__mro__:
+        collection_name = SUPERCLASSES_TO_COLLECTION_NAMES.get(superclass)
+        if collection_name is not None:
+            _CLASS_TO_COLLECTION_CACHE[model_class] = collection_name
             return collection_name
     raise ValueError(f"{model_class} class is not subclass of any model")
@@ -1,9 +1,34 @@
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
+from itertools import chain, groupby
 from typing import Union, List
 from pydantic import BaseModel
 import pymongo
 from bson import ObjectId
 from datetime import datetime, timezone
 
+# epoch references for converting stored point datetimes back to float timestamps
+# with plain datetime arithmetic, which is several times faster per point than
+# attaching a timezone and calling timestamp()
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch_seconds(point_datetime: datetime) -> float:
+    epoch = _EPOCH_NAIVE if point_datetime.tzinfo is None else _EPOCH_UTC
+    return (point_datetime - epoch).total_seconds()
+
+
+# runs on every key of every document read or written; the set of field names in a
+# deployment is small, so after warm-up each check is a single cache lookup
+@lru_cache(maxsize=None)
+def _field_is_id(field) -> bool:
+    if type(field) is not str:
+        return False
+    return field == "id" or field.endswith(("_id", ".id"))
+
+
 
 from grisera import (
     SignalIn,
@@ -13,21 +38,54 @@ from grisera import (
 )
 from grisera import NotFoundByIdModel
 from mongo_service.collection_mapping import get_collection_name, Collections
-from mongo_service.mongodb_api_config import mongo_api_address, mongo_database_name
+from mongo_service.read_cache import invalidate_cached_reads
+from mongo_service.request_cache import invalidate_cached
+from mongo_service.mongodb_api_config import (
+    mongo_api_address,
+    mongo_appname,
+    mongo_compressors,
+    mongo_database_name,
+    mongo_max_pool_size,
+    mongo_min_pool_size,
+    mongo_ts_batch_size,
+)
 
-client = pymongo.MongoClient(mongo_api_address)
+client = pymongo.MongoClient(
+    mongo_api_address,
+    maxPoolSize=mongo_max_pool_size,
+    minPoolSize=mongo_min_pool_size,
+    # halves the wire bytes of large reads such as dense time series when the
+    # server supports a listed compressor
+    compressors=mongo_compressors,
+    appname=mongo_appname,
+)
 db = client[mongo_database_name]
 
 
 class MongoApiService:
     """
-    Object that handles direct communication with mongodb
+    Object that handles direct communication with mongodb. The class is a singleton
+    sharing the module-level MongoClient, so all services reuse one connection pool
+    instead of recreating it per service object.
     """
 
     MONGO_ID_FIELD = "_id"
     MODEL_ID_FIELD = "id"
     TIMESTAMP_FIELD = "timestamp"
     METADATA_FIELD = "metadata"
+    # dotted paths into the metadata subdocument, built once instead of with an
+    # f-string on every hot-path query
+    METADATA_ID_FIELD = f"{METADATA_FIELD}.id"
+    METADATA_PREFIX = f"{METADATA_FIELD}."
+
+    _ensured_indexes = set()
+    _ts_collections_ready = set()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __init__(self):
         """
@@ -35,8 +93,60 @@ class MongoApiService:
         """
         self.db = db
         self.client = client
+        self._db_cache = {}
+        self._transactions_supported = None
+
+    def _db(self, dataset_id: Union[int, str]):
+        """
+        Return the database of given dataset. Handles are memoized, so the hot paths
+        do not rebuild a Database object per call.
+        """
+        database = self._db_cache.get(dataset_id)
+        if database is None:
+            database = self._db_cache[dataset_id] = self.client[dataset_id]
+        return database
 
 
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager yielding a session for running several operations atomically.
+        Yields None when the server does not support transactions (standalone
+        instances, where sessions exist but the first transactional operation fails,
+        or mongomock), so read-modify-write callers degrade to the previous unguarded
+        behavior instead of failing.
+        """
+        if not self._supports_transactions():
+            yield None
+            return
+        try:
+            session = self.client.start_session()
+        except (NotImplementedError, pymongo.errors.PyMongoError):
+            yield None
+            return
+        with session:
+            with session.start_transaction():
+                yield session
+
+    def _supports_transactions(self):
+        """
+        Probe whether the deployment supports transactions. Sessions alone are not
+        enough: a standalone mongod hands out sessions, but rejects the first
+        operation run inside a transaction, so the topology is checked instead -
+        transactions need a replica set member or mongos. The probe result is kept
+        for the lifetime of the client.
+        """
+        if self._transactions_supported is None:
+            try:
+                hello = self.client.admin.command("hello")
+            except (NotImplementedError, pymongo.errors.PyMongoError):
+                self._transactions_supported = False
+            else:
+                self._transactions_supported = (
+                    "setName" in hello or hello.get("msg") == "isdbgrid"
+                )
+        return self._transactions_supported
+
     def create_document(self, data_in: BaseModel, dataset_id: Union[int, str]):
         """
         Create new document from model object.
@@ -51,16 +161,49 @@ class MongoApiService:
         Create new document from a dictionary. Id fields are converted to ObjectId type.
         """
         self._fix_input_ids(document_dict)
-        db = self.client[dataset_id]
+        db = self._db(dataset_id)
         created_id = db[collection_name].insert_one(document_dict).inserted_id
         return str(created_id)
 
 
+    def insert_many(self, collection_name: str, documents: List[dict], dataset_id: Union[int, str]):
+        """
+        Create many documents with a single insert_many instead of one insert per
+        document. Id fields in documents are converted to ObjectId type. Returns ids of
+        created documents as str.
+        """
+        for document in documents:
+            self._fix_input_ids(document)
+        db = self._db(dataset_id)
+        created_ids = db[collection_name].insert_many(documents, ordered=False).inserted_ids
+        return [str(created_id) for created_id in created_ids]
+
+    def bulk_update(self, collection_name: str, updates: dict, dataset_id: Union[int, str]):
+        """
+        Update many documents with a single bulk_write instead of one update per
+        document. Takes a dict mapping document ids to the fields to '$set'; id fields
+        in the set payloads are converted to ObjectId type. Returns the number of
+        modified documents.
+        """
+        operations = []
+        for id, fields_to_update in updates.items():
+            self._fix_input_ids(fields_to_update)
+            operations.append(
+                pymongo.UpdateOne(
+                    {self.MONGO_ID_FIELD: ObjectId(id)},
+                    {"$set": fields_to_update},
+                )
+            )
+        if not operations:
+            return 0
+        db = self._db(dataset_id)
+        return db[collection_name].bulk_write(operations, ordered=False).modified_count
+
     def get_document(self, id: Union[str, int], collection_name: str, dataset_id: Union[int, str], *args, **kwargs):
         """
         Load single document. Output id fields are converted from ObjectId type to str.
         """
-        db = self.client[dataset_id]
+        db = self._db(dataset_id)
         result_dict = db[collection_name].find_one(
             {self.MONGO_ID_FIELD: ObjectId(id)}, *args, **kwargs
         )
@@ -71,10 +214,56 @@ class MongoApiService:
                 errors={"errors": "document not found"},
             )
 
+        # id conversion is done on a copy: some backends (e.g. mongomock) return
+        # documents aliasing their store, so converting in place would flip the
+        # stored ObjectId fields to str and break later id-matched writes
+        result_dict = deepcopy(result_dict)
         self._update_mongo_output_id(result_dict)
         return result_dict
 
 
+    def ensure_index(self, collection_name: str, keys: List, dataset_id: Union[int, str]):
+        """
+        Create index on given collection if it was not ensured yet. Ensured indexes are
+        cached per dataset, so calling this on a hot path costs a single set lookup.
+        """
+        cache_key = (str(dataset_id), str(collection_name), tuple(keys))
+        if cache_key in self._ensured_indexes:
+            return
+        db = self._db(dataset_id)
+        db[collection_name].create_index(keys)
+        self._ensured_indexes.add(cache_key)
+
+    def document_exists(self, id: Union[str, int], collection_name: str, dataset_id: Union[int, str]):
+        """
+        Check whether document with given id exists. Only the id is matched server side,
+        so no document is sent over the wire.
+        """
+        db = self._db(dataset_id)
+        return (
+            db[collection_name].count_documents(
+                {self.MONGO_ID_FIELD: ObjectId(id)}, limit=1
+            )
+            > 0
+        )
+
+    def get_document_by_query(self, query: dict, collection_name: str, dataset_id: Union[int, str], *args, **kwargs):
+        """
+        Load single document matching given query. Returns None when no document
+        matches. Id fields in query and output are converted between ObjectId and str.
+        """
+        self._fix_input_ids(query)
+        db = self._db(dataset_id)
+        result_dict = db[collection_name].find_one(query, *args, **kwargs)
+
+        if result_dict is None:
+            return None
+
+        # copy before id conversion, see get_document
+        result_dict = deepcopy(result_dict)
+        self._update_mongo_output_id(result_dict)
+        return result_dict
+
     def get_documents(self, collection_name: str, dataset_id: Union[int, str], query: dict = {}, *args, **kwargs):
         """
         Load many documents. Output id fields are converted from ObjectId type to str.
@@ -83,14 +272,64 @@ class MongoApiService:
             dataset_id = mongo_database_name
 
         self._fix_input_ids(query)
-        db = self.client[dataset_id]
-        results = list(db[collection_name].find(query, *args, **kwargs))
+        db = self._db(dataset_id)
+        # copies before id conversion, see get_document
+        results = [deepcopy(result) for result in db[collection_name].find(query, *args, **kwargs)]
 
-        [self._update_mongo_output_id(result) for result in results]
+        for result in results:
+            self._update_mongo_output_id(result)
 
         return results
 
 
+    def get_many_by_ids(self, collection_name: str, ids: List[Union[str, int]], dataset_id: Union[int, str], *args, **kwargs):
+        """
+        Load many documents by their ids with a single '$in' query instead of one
+        find_one per id. Returns a dict mapping each found id (as str) to its document,
+        so callers fetching a batch can demultiplex results; missing ids are absent
+        from the dict. Output id fields are converted from ObjectId type to str.
+        """
+        db = self._db(dataset_id)
+        results = db[collection_name].find(
+            {self.MONGO_ID_FIELD: self.get_id_in_query(ids)}, *args, **kwargs
+        )
+
+        results_by_id = {}
+        for result in results:
+            # copy before id conversion, see get_document
+            result = deepcopy(result)
+            self._update_mongo_output_id(result)
+            results_by_id[result[self.MODEL_ID_FIELD]] = result
+        return results_by_id
+
+    def iter_documents(self, collection_name: str, dataset_id: Union[int, str], query: dict = {}, *args, **kwargs):
+        """
+        Iterate over many documents without materializing them all at once. Output id
+        fields are converted from ObjectId type to str.
+        """
+        if dataset_id == "":
+            dataset_id = mongo_database_name
+
+        self._fix_input_ids(query)
+        db = self._db(dataset_id)
+        for result in db[collection_name].find(query, *args, **kwargs):
+            # copy before id conversion, see get_document
+            result = deepcopy(result)
+            self._update_mongo_output_id(result)
+            yield result
+
+    def aggregate(self, collection_name: str, pipeline: List[dict], dataset_id: Union[int, str], fix_output_ids: bool = True, **kwargs):
+        """
+        Run aggregation pipeline on given collection. When fix_output_ids is set, id
+        fields in output documents are converted from ObjectId type to str. Extra
+        keyword arguments (e.g. batchSize) are passed through to pymongo.
+        """
+        db = self._db(dataset_id)
+        results = list(db[collection_name].aggregate(pipeline, **kwargs))
+        if fix_output_ids:
+            [self._fix_output_ids(result) for result in results]
+        return results
+
     def update_document(self, id: Union[str, int], data_to_update: BaseModel, dataset_id: Union[int, str]):
         """
         Update document.
@@ -101,20 +340,92 @@ class MongoApiService:
 
 
     def update_document_with_dict(
-        self, collection_name: str, id: Union[str, int], new_document: dict, dataset_id: Union[int, str]
+        self, collection_name: str, id: Union[str, int], new_document: dict, dataset_id: Union[int, str],
+        session=None,
     ):
         """
         Update document with new document as dict. Id fields are converted to ObjectId type.
         """
         self._update_mongo_input_id(new_document)
         id = ObjectId(id)
-        db = self.client[dataset_id]
+        db = self._db(dataset_id)
         db[collection_name].replace_one(
             {self.MONGO_ID_FIELD: id},
             new_document,
+            session=session,
         )
 
 
+    def find_one_and_update(
+        self,
+        id: Union[str, int],
+        data_to_update: BaseModel,
+        dataset_id: Union[int, str],
+        query: dict = None,
+        return_after: bool = True,
+    ):
+        """
+        Atomically update document and return it in a single round trip, instead of an
+        update followed by a separate read. Optional query narrows the match beyond the
+        id. Returns None when no document matches.
+        """
+        collection_name = get_collection_name(type(data_to_update))
+        update_dict = data_to_update.dict(exclude_unset=True)
+        self._fix_input_ids(update_dict)
+        filter_query = {self.MONGO_ID_FIELD: ObjectId(id)}
+        if query:
+            filter_query.update(query)
+        db = self._db(dataset_id)
+        result = db[collection_name].find_one_and_update(
+            filter_query,
+            {"$set": update_dict},
+            return_document=(
+                pymongo.ReturnDocument.AFTER
+                if return_after
+                else pymongo.ReturnDocument.BEFORE
+            ),
+        )
+        if result is None:
+            return None
+        self._update_mongo_output_id(result)
+        return result
+
+    def find_one_and_replace_document(
+        self, collection_name: str, id: Union[str, int], new_document: dict, dataset_id: Union[int, str]
+    ):
+        """
+        Atomically replace document and return the new version in a single round trip,
+        instead of a replace followed by a separate read. Id fields are converted to
+        ObjectId type. Returns None when no document matches.
+        """
+        self._update_mongo_input_id(new_document)
+        db = self._db(dataset_id)
+        result = db[collection_name].find_one_and_replace(
+            {self.MONGO_ID_FIELD: ObjectId(id)},
+            new_document,
+            return_document=pymongo.ReturnDocument.AFTER,
+        )
+        if result is None:
+            return None
+        self._update_mongo_output_id(result)
+        return result
+
+    def find_one_and_delete_document(
+        self, collection_name: str, id: Union[str, int], dataset_id: Union[int, str]
+    ):
+        """
+        Atomically delete document and return it in a single round trip, instead of a
+        read followed by a separate delete. Returns None when no document matches.
+        """
+        db = self._db(dataset_id)
+        result = db[collection_name].find_one_and_delete(
+            {self.MONGO_ID_FIELD: ObjectId(id)}
+        )
+        if result is None:
+            return None
+        self._update_mongo_output_id(result)
+        return result
+
     def delete_document(self, object_to_delete: BaseModel, dataset_id: Union[int, str]):
         """
         Delete document in collection. Given model must have id field.
@@ -126,17 +437,166 @@ class MongoApiService:
             )
         id = ObjectId(id_str)
         collection_name = get_collection_name(type(object_to_delete))
-        db = self.client[dataset_id]
+        db = self._db(dataset_id)
         db[collection_name].delete_one({self.MONGO_ID_FIELD: id})
         return id
 
+    def _invalidate_embedded_parent(
+        self, collection_name: str, parent_id: Union[str, int], dataset_id: Union[int, str]
+    ):
+        """
+        Drop cached reads of a parent document whose embedded array was just written.
+        The embedded writes bypass the service-level update paths, so without this the
+        caches would keep serving the pre-write parent: the request-scoped cache for
+        the rest of the request, the read cache until the entry expires.
+        """
+        key_prefix = (collection_name, str(dataset_id), str(parent_id))
+        invalidate_cached(key_prefix)
+        invalidate_cached_reads(key_prefix)
+
+    def push_embedded(
+        self,
+        collection_name: str,
+        parent_id: Union[str, int],
+        field: str,
+        value: dict,
+        dataset_id: Union[int, str],
+    ):
+        """
+        Append single element to embedded array with '$push' operator. Only the new
+        element is sent instead of the whole parent document. Id fields in the element
+        are converted to ObjectId type.
+        """
+        self._fix_input_ids(value)
+        db = self._db(dataset_id)
+        result = db[collection_name].update_one(
+            {self.MONGO_ID_FIELD: ObjectId(parent_id)},
+            {"$push": {field: value}},
+        )
+        self._invalidate_embedded_parent(collection_name, parent_id, dataset_id)
+        return result
+
+    def bulk_push_embedded(
+        self,
+        collection_name: str,
+        field: str,
+        values_by_parent_id: dict,
+        dataset_id: Union[int, str],
+    ):
+        """
+        Append elements to embedded arrays of many parent documents with a single
+        bulk_write. Expects a dict mapping parent id to list of new elements. Id fields
+        in elements are converted to ObjectId type.
+        """
+        for values in values_by_parent_id.values():
+            for value in values:
+                self._fix_input_ids(value)
+        db = self._db(dataset_id)
+        result = db[collection_name].bulk_write(
+            [
+                pymongo.UpdateOne(
+                    {self.MONGO_ID_FIELD: ObjectId(parent_id)},
+                    {"$push": {field: {"$each": values}}},
+                )
+                for parent_id, values in values_by_parent_id.items()
+            ],
+            ordered=False,
+        )
+        for parent_id in values_by_parent_id:
+            self._invalidate_embedded_parent(collection_name, parent_id, dataset_id)
+        return result
+
+    def update_embedded(
+        self,
+        collection_name: str,
+        parent_id: Union[str, int],
+        field: str,
+        element_id: Union[str, int],
+        new_element: dict,
+        dataset_id: Union[int, str],
+    ):
+        """
+        Update single element of embedded array with positional '$' operator. Element is
+        matched by its id field, so only the new element is sent instead of the whole
+        parent document. Id fields in new element are converted to ObjectId type.
+        """
+        self._fix_input_ids(new_element)
+        db = self._db(dataset_id)
+        result = db[collection_name].update_one(
+            {
+                self.MONGO_ID_FIELD: ObjectId(parent_id),
+                f"{field}.{self.MODEL_ID_FIELD}": ObjectId(element_id),
+            },
+            {"$set": {f"{field}.$": new_element}},
+        )
+        self._invalidate_embedded_parent(collection_name, parent_id, dataset_id)
+        return result
+
+    def update_embedded_fields(
+        self,
+        collection_name: str,
+        parent_id: Union[str, int],
+        field: str,
+        element_id: Union[str, int],
+        fields_to_update: dict,
+        dataset_id: Union[int, str],
+    ):
+        """
+        Update given fields of single embedded array element with positional '$'
+        operator. Only the changed fields are sent over the wire. Id fields in values
+        are converted to ObjectId type.
+        """
+        self._fix_input_ids(fields_to_update)
+        update_dict = {
+            f"{field}.$.{updated_field}": value
+            for updated_field, value in fields_to_update.items()
+        }
+        db = self._db(dataset_id)
+        result = db[collection_name].update_one(
+            {
+                self.MONGO_ID_FIELD: ObjectId(parent_id),
+                f"{field}.{self.MODEL_ID_FIELD}": ObjectId(element_id),
+            },
+            {"$set": update_dict},
+        )
+        self._invalidate_embedded_parent(collection_name, parent_id, dataset_id)
+        return result
+
+    def pull_embedded(
+        self,
+        collection_name: str,
+        parent_id: Union[str, int],
+        field: str,
+        element_id: Union[str, int],
+        dataset_id: Union[int, str],
+    ):
+        """
+        Remove single element of embedded array with '$pull' operator. Element is matched
+        by its id field, so the whole parent document is not rewritten.
+        """
+        db = self._db(dataset_id)
+        result = db[collection_name].update_one(
+            {
+                self.MONGO_ID_FIELD: ObjectId(parent_id),
+                f"{field}.{self.MODEL_ID_FIELD}": ObjectId(element_id),
+            },
+            {"$pull": {field: {self.MODEL_ID_FIELD: ObjectId(element_id)}}},
+        )
+        self._invalidate_embedded_parent(collection_name, parent_id, dataset_id)
+        return result
+
     def create_time_series(self, time_series_in: TimeSeriesIn, dataset_id: Union[int, str]):
         collection_name = Collections.TIME_SERIES
         self._create_ts_collection_if_missing(collection_name, dataset_id)
         ts_id = ObjectId()
         ts_documents = self._time_series_into_documents(time_series_in, ts_id)
-        db = self.client[dataset_id]
-        db[collection_name].insert_many(ts_documents)
+        db = self._db(dataset_id)
+        # unordered, so the server can apply the internal batches in parallel, and
+        # without server-side schema validation, which pydantic already performed;
+        # the driver splits large document lists into wire-size batches itself
+        db[collection_name].insert_many(
+            ts_documents, ordered=False, bypass_document_validation=True
+        )
         return ts_id
 
     def get_time_series(
@@ -151,14 +611,24 @@ class MongoApiService:
         """
         collection_name = Collections.TIME_SERIES
         query = self._create_ts_query(ts_id, signal_min_value, signal_max_value)
-        db = self.client[dataset_id]
-        time_series_documents = list(db[collection_name].find(query))
-        if len(time_series_documents) == 0:
+        db = self._db(dataset_id)
+        # metadata is duplicated into every point document; it is read once here and
+        # excluded from the point stream, so a dense series does not transfer and
+        # decode the same subdocument per point
+        metadata_document = db[collection_name].find_one(
+            query, {self.METADATA_FIELD: 1}
+        )
+        if metadata_document is None:
             return NotFoundByIdModel(
                 id=ts_id,
                 errors={"errors": "time series not found"},
             )
-        return self._time_series_documents_to_dict(time_series_documents)
+        point_documents = db[collection_name].find(
+            query, {self.METADATA_FIELD: 0}, batch_size=mongo_ts_batch_size
+        )
+        return self._time_series_points_to_dict(
+            metadata_document[self.METADATA_FIELD], point_documents
+        )
 
     def get_many_time_series(self, dataset_id: Union[int, str], query={}, query_params=None):
         if query_params:
@@ -169,22 +639,35 @@ class MongoApiService:
                 query = {}
         else:
             self._fix_input_ids(query)
+        # the point documents come back as one flat cursor sorted by series id and
+        # are regrouped while streaming; the previous '$group'/'$push' aggregation
+        # buffered each whole series into a single document server side, which both
+        # held every series in aggregation memory and broke on the 16MB document
+        # limit for dense series
         ts_documents = self._get_many_ts(dataset_id, query)
-        return [
-            self._time_series_documents_to_dict(ts_document["value"])
-            for ts_document in list(ts_documents)
-        ]
+        results = []
+        for _, series_documents in groupby(
+            ts_documents, key=lambda document: document[self.METADATA_FIELD]["id"]
+        ):
+            first_document = next(series_documents)
+            results.append(
+                self._time_series_points_to_dict(
+                    first_document[self.METADATA_FIELD],
+                    chain([first_document], series_documents),
+                )
+            )
+        return results
 
     def update_time_series_metadata(
         self, fields_to_update: dict, time_series_id: Union[int, str], dataset_id: Union[int, str]
     ):
         ts_id = ObjectId(time_series_id)
-        query = {f"{self.METADATA_FIELD}.id": ts_id}
+        query = {self.METADATA_ID_FIELD: ts_id}
+        prefix = self.METADATA_PREFIX
         update_dict = {
-            f"{self.METADATA_FIELD}.{field}": value
-            for field, value in fields_to_update.items()
+            prefix + field: value for field, value in fields_to_update.items()
         }
-        db = self.client[dataset_id]
+        db = self._db(dataset_id)
         return db[Collections.TIME_SERIES].update_many(
             filter=query, update={"$set": update_dict}
         )
@@ -203,13 +686,18 @@ class MongoApiService:
 
     def delete_time_series(self, time_series_id: Union[int, str], dataset_id: Union[int, str]):
         ts_id = ObjectId(time_series_id)
-        query = {f"{self.METADATA_FIELD}.id": ts_id}
-        db = self.client[dataset_id]
+        query = {self.METADATA_ID_FIELD: ts_id}
+        db = self._db(dataset_id)
         return db[Collections.TIME_SERIES].delete_many(filter=query)
 
 
     def get_id_in_query(self, id_list: List):
-        return {"$in": [ObjectId(str(id)) for id in id_list]}
+        # ids already in ObjectId form are passed through without the str round trip
+        return {
+            "$in": [
+                id if isinstance(id, ObjectId) else ObjectId(id) for id in id_list
+            ]
+        }
 
     def _update_mongo_input_id(self, mongo_input: dict):
         """
@@ -240,7 +728,7 @@ class MongoApiService:
         """
 
         def fix_input_id(field, value):
-            if self._field_is_id(field) and value is not None:
+            if _field_is_id(field) and value is not None:
                 return ObjectId(value)
             return value
 
@@ -253,36 +741,39 @@ class MongoApiService:
         """
 
         def fix_output_id(field, value):
-            if self._field_is_id(field) and value is not None:
+            if _field_is_id(field) and value is not None:
                 return str(value)
             return value
 
         self._mongo_object_deep_iterate(mongo_document, fix_output_id)
 
-    @staticmethod
-    def _field_is_id(field):
-        if type(field) is not str:
-            return False
-        return field == "id" or field[-3:] in ("_id", ".id")
-
     def _mongo_object_deep_iterate(self, mongo_object: dict, func):
         """
         Call a function on each primitive value in mongo output document or input query
         dict. Mongo document field values are either primitives, dicts or arrays.
+        Walked with an explicit stack instead of recursion, so deeply traversed
+        documents do not pay a Python frame per nesting level.
         """
-        if type(mongo_object) is not dict:
-            return
-        for field, value in mongo_object.items():
-            if type(value) is dict:
-                self._mongo_object_deep_iterate(value, func)
-            elif type(value) is list:
-                for list_elem in value:
-                    self._mongo_object_deep_iterate(list_elem, func)
-            else:
-                mongo_object[field] = func(field, mongo_object[field])
+        stack = [mongo_object]
+        while stack:
+            current = stack.pop()
+            if type(current) is not dict:
+                continue
+            for field, value in current.items():
+                if type(value) is dict:
+                    stack.append(value)
+                elif type(value) is list:
+                    stack.extend(value)
+                else:
+                    current[field] = func(field, value)
 
     def _create_ts_collection_if_missing(self, collection_name: str, dataset_id: Union[int, str]):
-        db = self.client[dataset_id]
+        # collections already found or created are remembered, so inserts after the
+        # first do not pay the list_collection_names round trip
+        cache_key = (str(dataset_id), str(collection_name))
+        if cache_key in self._ts_collections_ready:
+            return
+        db = self._db(dataset_id)
         if collection_name not in db.list_collection_names():
             db.create_collection(
                 collection_name,
@@ -291,6 +782,7 @@ class MongoApiService:
                     "metaField": self.METADATA_FIELD,
                 },
             )
+        self._ts_collections_ready.add(cache_key)
 
     def _time_series_into_documents(
         self, time_series_in: TimeSeriesIn, time_series_id: ObjectId
@@ -344,9 +836,17 @@ class MongoApiService:
         Convert documents from single time series to BasicTimeSeriesOut
         """
         metadata = ts_documents[0][self.METADATA_FIELD]
+        return self._time_series_points_to_dict(metadata, ts_documents)
+
+    def _time_series_points_to_dict(self, metadata: dict, point_documents):
+        """
+        Convert given metadata and iterable of point documents from single time series
+        to BasicTimeSeriesOut
+        """
         type = metadata["type"]
         signal_values = [
-            self._signal_from_ts_document(document, type) for document in ts_documents
+            self._signal_from_ts_document(document, type)
+            for document in point_documents
         ]
         result = {
             "signal_values": signal_values,
@@ -358,9 +858,7 @@ class MongoApiService:
     def _signal_from_ts_document(self, document, type):
         if type == "Timestamp":
             return SignalIn(
-                timestamp=document[self.TIMESTAMP_FIELD]
-                .replace(tzinfo=timezone.utc)
-                .timestamp(),
+                timestamp=_to_epoch_seconds(document[self.TIMESTAMP_FIELD]),
                 signal_value=SignalValueNodesIn(
                     value=document["value"],
                     additional_properties=document["additional_properties"],
@@ -368,12 +866,12 @@ class MongoApiService:
             )
         else:
             return SignalIn(
-                start_timestamp=document[self.TIMESTAMP_FIELD]
-                .replace(tzinfo=timezone.utc)
-                .timestamp(),
-                end_timestamp=(document["end_timestamp"] if "end_timestamp" in document else document[self.TIMESTAMP_FIELD])
-                .replace(tzinfo=timezone.utc)
-                .timestamp(),
+                start_timestamp=_to_epoch_seconds(document[self.TIMESTAMP_FIELD]),
+                end_timestamp=_to_epoch_seconds(
+                    document["end_timestamp"]
+                    if "end_timestamp" in document
+                    else document[self.TIMESTAMP_FIELD]
+                ),
                 signal_value=SignalValueNodesIn(
                     value=document["value"],
                     additional_properties=document["additional_properties"],
@@ -386,7 +884,7 @@ class MongoApiService:
         signal_min_value: int = None,
         signal_max_value: int = None,
     ):
-        query = {f"{self.METADATA_FIELD}.id": ObjectId(ts_id)}
+        query = {self.METADATA_ID_FIELD: ObjectId(ts_id)}
 
         value_query = {}
         if signal_min_value is not None:
@@ -399,20 +897,42 @@ class MongoApiService:
         return query
 
     def _get_many_ts(self, dataset_id: Union[int, str], query={}):
-        aggregation = [
-            {"$match": query},
-            {"$group": {"_id": "$metadata.id", "value": {"$push": "$$ROOT"}}},
-        ]
-        db = self.client[dataset_id]
-        return db[Collections.TIME_SERIES].aggregate(aggregation)
+        self.ensure_index(
+            Collections.TIME_SERIES,
+            [(self.METADATA_ID_FIELD, pymongo.ASCENDING)],
+            dataset_id,
+        )
+        db = self._db(dataset_id)
+        return db[Collections.TIME_SERIES].find(
+            query,
+            sort=[(self.METADATA_ID_FIELD, pymongo.ASCENDING)],
+            batch_size=mongo_ts_batch_size,
+        )
 
     def _replace_ts(self, new_time_series: dict, time_series_id: Union[int, str], dataset_id: Union[int, str]):
-        with self.client.start_session() as session:
-            with session.start_transaction():
-                self.delete_time_series(time_series_id, dataset_id)
-                self.create_time_series(TimeSeriesIn(**new_time_series), dataset_id)
+        # the delete of the old points and the insert of the new ones go out as one
+        # ordered bulk_write, a single round trip instead of a delete_many and an
+        # insert_many inside a transaction
+        self._create_ts_collection_if_missing(Collections.TIME_SERIES, dataset_id)
+        new_documents = self._time_series_into_documents(
+            TimeSeriesIn(**new_time_series), ObjectId()
+        )
+        operations = [
+            pymongo.DeleteMany({self.METADATA_ID_FIELD: ObjectId(time_series_id)})
+        ]
+        operations.extend(pymongo.InsertOne(document) for document in new_documents)
+        db = self._db(dataset_id)
+        db[Collections.TIME_SERIES].bulk_write(operations, ordered=True)
 
     def _get_many_ts_filtered(self, query_params, dataset_id: Union[int, str]):
+        """
+        Resolve the recording/participant/experiment filter params to time series ids.
+        Every filter path ends at observable information ids, so the branches collect
+        and intersect those instead of joining each traversal into the time series
+        collection; the previous per-branch '$lookup' into timeSeries copied every
+        point document of every matching series into a single aggregation group. The
+        intersection is mapped to series ids with one indexed distinct at the end.
+        """
         recording_params = {}
         participant_state_params = {}
         participant_params = {}
@@ -428,72 +948,64 @@ class MongoApiService:
             elif entity == "experiment":
                 experiment_params[property] = query_params[key]
 
-        ts_by_recording = None
+        oi_id_sets = []
         if recording_params != {}:
-            ts_by_recording = list(self._get_ts_by_recording(recording_params, dataset_id))
-
-        ts_by_participant = None
+            oi_id_sets.append(
+                set(self._get_oi_ids_by_recording(recording_params, dataset_id))
+            )
         if participant_state_params != {} or participant_params != {}:
-            ts_by_participant = list(
-                self._get_ts_by_pariticipant(
-                    pariticipant_state_params=participant_state_params,
-                    participant_params=participant_params,
-                    dataset_id=dataset_id,
+            oi_id_sets.append(
+                set(
+                    self._get_oi_ids_by_participant(
+                        participant_state_params=participant_state_params,
+                        participant_params=participant_params,
+                        dataset_id=dataset_id,
+                    )
                 )
             )
-
-        ts_by_experiment = None
         if experiment_params != {}:
-            ts_by_experiment = list(self._get_ts_by_experiment(experiment_params, dataset_id=dataset_id))
+            oi_id_sets.append(
+                set(self._get_oi_ids_by_experiment(experiment_params, dataset_id=dataset_id))
+            )
 
-        non_empty_lists = [
-            ts_list
-            for ts_list in (ts_by_recording, ts_by_participant, ts_by_experiment)
-            if ts_list is not None
-        ]
-        if not len(non_empty_lists):
+        if not oi_id_sets:
             return None
 
+        matching_oi_ids = set.intersection(*oi_id_sets)
+        if not matching_oi_ids:
+            return []
 
-        matching_ts_ids = set(non_empty_lists[0])
-        for ts_ids in non_empty_lists[1:]:
-            matching_ts_ids = matching_ts_ids.intersection(set(ts_ids))
-
-        return list(matching_ts_ids)
+        self.ensure_index(
+            Collections.TIME_SERIES,
+            [(f"{self.METADATA_PREFIX}observable_information_id", pymongo.ASCENDING)],
+            dataset_id,
+        )
+        db = self._db(dataset_id)
+        return db[Collections.TIME_SERIES].distinct(
+            self.METADATA_ID_FIELD,
+            {
+                f"{self.METADATA_PREFIX}observable_information_id": {
+                    "$in": list(matching_oi_ids)
+                }
+            },
+        )
 
-    def _get_ts_by_recording(self, recording_params, dataset_id: Union[int, str]):
+    def _get_oi_ids_by_recording(self, recording_params, dataset_id: Union[int, str]):
         match_params = {}
         for key, value in recording_params.items():
             if key == "id":
                 match_params["_id"] = ObjectId(value)
             else:
                 match_params[key] = value
-        aggregation = [
-            {"$match": match_params},
-            {
-                "$lookup": {
-                    "from": "timeSeries",
-                    "localField": "observable_informations.id",
-                    "foreignField": "metadata.observable_information_id",
-                    "as": "timeSeries",
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "tsIds": {"$addToSet": {"$setUnion": "$timeSeries.metadata.id"}},
-                }
-            },
-            {"$unwind": "$tsIds"},
-            {"$project": {"_id": 0}},
-        ]
-        db = self.client[dataset_id]
-        aggregation_result = list(db[Collections.RECORDING].aggregate(aggregation))
-        return aggregation_result[0]["tsIds"] if len(aggregation_result) else []
+        db = self._db(dataset_id)
+        # distinct walks the embedded array server side and returns only the ids
+        return db[Collections.RECORDING].distinct(
+            "observable_informations.id", match_params
+        )
 
-    def _get_ts_by_pariticipant(self, pariticipant_state_params, participant_params, dataset_id: Union[int, str]):
+    def _get_oi_ids_by_participant(self, participant_state_params, participant_params, dataset_id: Union[int, str]):
         match_params = {}
-        for key, value in pariticipant_state_params.items():
+        for key, value in participant_state_params.items():
             if key == "id":
                 match_params["participant_states.id"] = ObjectId(value)
             else:
@@ -504,15 +1016,11 @@ class MongoApiService:
             else:
                 match_params[key] = value
         aggregation = self._get_participant_aggregation(match_params)
-        db = self.client[dataset_id]
+        db = self._db(dataset_id)
         aggregation_result = list(
             db[Collections.PARTICIPANT].aggregate(aggregation)
         )
-        results = []
-        for ar in aggregation_result:
-            results.extend(ar["tsIds"])
-
-        return results
+        return aggregation_result[0]["oiIds"] if len(aggregation_result) else []
 
     def _get_participant_aggregation(self, match_params):
         return [
@@ -537,25 +1045,16 @@ class MongoApiService:
             },
             {"$unwind": "$recordings"},
             {"$unwind": "$recordings.observable_informations"},
-            {
-                "$lookup": {
-                    "from": "timeSeries",
-                    "localField": "recordings.observable_informations.id",
-                    "foreignField": "metadata.observable_information_id",
-                    "as": "timeSeries",
-                }
-            },
             {
                 "$group": {
                     "_id": None,
-                    "tsIds": {"$addToSet": {"$setUnion": "$timeSeries.metadata.id"}},
+                    "oiIds": {"$addToSet": "$recordings.observable_informations.id"},
                 }
             },
-            {"$unwind": "$tsIds"},
             {"$project": {"_id": 0}},
         ]
 
-    def _get_ts_by_experiment(self, experiment_params, dataset_id: Union[int, str]):
+    def _get_oi_ids_by_experiment(self, experiment_params, dataset_id: Union[int, str]):
         match_params = {}
         for key, value in experiment_params.items():
             if key == "id":
@@ -601,25 +1100,16 @@ class MongoApiService:
             },
             {"$unwind": "$recordings"},
             {"$unwind": "$recordings.observable_informations"},
-            {
-                "$lookup": {
-                    "from": "timeSeries",
-                    "localField": "recordings.observable_informations.id",
-                    "foreignField": "metadata.observable_information_id",
-                    "as": "timeSeries",
-                }
-            },
             {
                 "$group": {
                     "_id": None,
-                    "tsIds": {"$addToSet": {"$setUnion": "$timeSeries.metadata.id"}},
+                    "oiIds": {"$addToSet": "$recordings.observable_informations.id"},
                 }
             },
-            {"$unwind": "$tsIds"},
             {"$project": {"_id": 0}},
         ]
-        db = self.client[dataset_id]
+        db = self._db(dataset_id)
         aggregation_result = list(
             db[Collections.PARTICIPANT].aggregate(aggregation)
         )
-        return aggregation_result[0]["tsIds"] if len(aggregation_result) else []
+        return aggregation_result[0]["oiIds"] if len(aggregation_result) else []
@@ -6,3 +6,28 @@ mongo_api_port = os.environ.get("MONGO_API_PORT") or "27017"
 mongo_api_address = f"mongodb://{mongo_api_host}:{mongo_api_port}"
 
 mongo_database_name = os.environ.get("MONGO_DATABASE") or "road"
+
+# connection pool bounds of the shared MongoClient
+mongo_max_pool_size = int(os.environ.get("MONGO_MAX_POOL_SIZE") or 100)
+mongo_min_pool_size = int(os.environ.get("MONGO_MIN_POOL_SIZE") or 10)
+
+# wire compression negotiated with the server; zlib is always available client
+# side, snappy/zstd can be listed when their modules are installed
+mongo_compressors = os.environ.get("MONGO_COMPRESSORS") or "zlib"
+
+# client name reported to the server, shown in currentOp and the server logs, so
+# this service's operations can be told apart from other clients
+mongo_appname = os.environ.get("MONGO_APPNAME") or "grisera-core-mongo"
+
+# cursor batch size used by unbounded list endpoints; larger than the server default
+# of 101, so medium lists come back without extra getMore round trips
+mongo_list_batch_size = int(os.environ.get("MONGO_LIST_BATCH_SIZE") or 1000)
+
+# cursor batch size for time series point reads; larger than the list batch size,
+# as point documents are small and series run into millions of points
+mongo_ts_batch_size = int(os.environ.get("MONGO_TS_BATCH_SIZE") or 10_000)
+
+# process-local cache for single document reads; ttl of 0 or less disables the cache
+# entirely, which tests use to bypass it
+mongo_read_cache_ttl = float(os.environ.get("MONGO_READ_CACHE_TTL") or 60)
+mongo_read_cache_maxsize = int(os.environ.get("MONGO_READ_CACHE_MAXSIZE") or 10_000)
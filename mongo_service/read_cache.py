@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+
+from mongo_service.mongodb_api_config import (
+    mongo_read_cache_maxsize,
+    mongo_read_cache_ttl,
+)
+
+"""
+This module provides a process-local cache for single document reads, shared by all
+requests. Unlike the request-scoped cache, entries survive between requests until they
+expire or are invalidated by a write, so hot documents are not re-fetched from mongo on
+every request. Entries are evicted least-recently-used once the cache is full. Values
+are deep copied on store and on hit, so callers mutating a returned document cannot
+pollute the cache. Setting MONGO_READ_CACHE_TTL to 0 disables the cache.
+"""
+
+_read_cache = OrderedDict()
+_read_cache_lock = Lock()
+
+
+def get_cached_read(key):
+    """
+    Return a copy of the cached value for given key, or None when the key is missing,
+    expired, or the cache is disabled.
+    """
+    if mongo_read_cache_ttl <= 0:
+        return None
+    with _read_cache_lock:
+        entry = _read_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del _read_cache[key]
+            return None
+        _read_cache.move_to_end(key)
+        return deepcopy(value)
+
+
+def set_cached_read(key, value):
+    """
+    Store a copy of value for given key. Evicts least recently used entries when the
+    cache is full. No-op when the cache is disabled.
+    """
+    if mongo_read_cache_ttl <= 0:
+        return
+    with _read_cache_lock:
+        _read_cache[key] = (time.monotonic() + mongo_read_cache_ttl, deepcopy(value))
+        _read_cache.move_to_end(key)
+        while len(_read_cache) > mongo_read_cache_maxsize:
+            _read_cache.popitem(last=False)
+
+
+def invalidate_cached_reads(key_prefix: tuple):
+    """
+    Drop all entries whose key starts with given prefix. Used by write paths, so reads
+    following a write do not see the stale version.
+    """
+    with _read_cache_lock:
+        for key in [key for key in _read_cache if key[: len(key_prefix)] == key_prefix]:
+            del _read_cache[key]
@@ -0,0 +1,59 @@
+from contextvars import ContextVar
+
+"""
+This module provides a request-scoped cache for single document fetches. Services
+repeatedly fetch the same document within one request, e.g. for validation and for
+building the response, or when recursive traversal re-enters a service with identical
+arguments. The cache is stored in a ContextVar, so concurrent requests do not share
+entries. It is activated per HTTP request by a middleware in main.py; outside of an
+active cache every lookup is a miss and results are not retained.
+"""
+
+_request_cache: ContextVar = ContextVar("mongo_request_cache", default=None)
+
+
+def activate_request_cache():
+    """
+    Activate a fresh cache for the current context. Returns a token that has to be
+    passed to deactivate_request_cache once the request is finished.
+    """
+    return _request_cache.set({})
+
+
+def deactivate_request_cache(token):
+    """
+    Drop the cache of the current context.
+    """
+    _request_cache.reset(token)
+
+
+def get_cached(key):
+    """
+    Return cached value for given key, or None when the key is missing or no cache is
+    active.
+    """
+    cache = _request_cache.get()
+    if cache is None:
+        return None
+    return cache.get(key)
+
+
+def invalidate_cached(key_prefix: tuple):
+    """
+    Drop all entries whose key starts with given prefix from the active cache. Used by
+    write paths, so later reads within the same request do not see stale documents.
+    """
+    cache = _request_cache.get()
+    if cache is None:
+        return
+    for key in [key for key in cache if key[: len(key_prefix)] == key_prefix]:
+        del cache[key]
+
+
+def set_cached(key, value):
+    """
+    Store value for given key in the active cache. No-op when no cache is active.
+    """
+    cache = _request_cache.get()
+    if cache is not None:
+        cache[key] = value
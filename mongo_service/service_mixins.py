@@ -6,6 +6,12 @@ from pydantic import BaseModel
 from mongo_service.collection_mapping import get_collection_name
 from grisera import NotFoundByIdModel
 from mongo_service import MongoApiService
+from mongo_service.read_cache import (
+    get_cached_read,
+    invalidate_cached_reads,
+    set_cached_read,
+)
+from mongo_service.request_cache import get_cached, invalidate_cached, set_cached
 
 
 class GenericMongoServiceMixin:
@@ -20,13 +26,16 @@ class GenericMongoServiceMixin:
     def __init__(self):
         self.mongo_api_service = MongoApiService()
 
-    def create(self, object_in: BaseModel, dataset_id: Union[int, str]):
+    def create(self, object_in: BaseModel, dataset_id: Union[int, str], out_class=None):
         """
         Generic method for sending request to mongo api to create new document
 
         Args:
             object_in: Object based on which document is to be created
             dataset_id (int | str): name of dataset
+            out_class: Optional out model class of the result. Services whose collection
+                holds several model variants pass it explicitly instead of mutating
+                model_out_class, which is not safe on a shared service object.
 
         Returns:
             Result of request as data object
@@ -37,7 +46,44 @@ class GenericMongoServiceMixin:
 
         created_document_id = self.mongo_api_service.create_document(object_in, dataset_id)
 
-        return self.get_single(created_document_id, dataset_id)
+        if out_class is None:
+            return self.get_single(created_document_id, dataset_id)
+
+        result = self.get_single_dict(created_document_id, dataset_id)
+        if type(result) is NotFoundByIdModel:
+            return result
+        return out_class(**result)
+
+    def create_many(self, objects_in: list, dataset_id: Union[int, str]):
+        """
+        Generic method for sending request to mongo api to create many documents with a
+        single insert, instead of one round trip per document.
+
+        Args:
+            objects_in: Objects based on which documents are to be created
+            dataset_id (int | str): name of dataset
+
+        Returns:
+            Results of request as list of data objects, in input order
+        """
+        documents = []
+        for object_in in objects_in:
+            document = object_in.dict()
+            for field, value in document.items():
+                if isinstance(value, date) and not isinstance(value, datetime):
+                    document[field] = datetime.combine(value, datetime.min.time())
+            documents.append(document)
+
+        collection_name = get_collection_name(self.model_out_class)
+        self.mongo_api_service.insert_many(collection_name, documents, dataset_id)
+
+        # documents were built from validated In models, so validation is skipped;
+        # insert fixed the id fields in place, they are mapped back to str here
+        results = []
+        for document in documents:
+            self.mongo_api_service._update_mongo_output_id(document)
+            results.append(self.model_out_class.construct(**document))
+        return results
 
     def get_multiple(
         self, dataset_id: Union[int, str], query: dict = {}, depth: int = 0, source: str = "", *args, **kwargs
@@ -59,11 +105,84 @@ class GenericMongoServiceMixin:
             collection_name, dataset_id, query, *args, **kwargs
         )
 
-        for result in results_dict:
-            self._add_related_documents(result, dataset_id, depth, source)
+        # every traversal hook no-ops for depth <= 0, so the per-result calls are
+        # skipped entirely on the common depth=0 path
+        if depth > 0:
+            self._add_related_documents_bulk(results_dict, dataset_id, depth, source)
 
         return results_dict
 
+    def _add_related_documents_bulk(
+        self, results: list, dataset_id: Union[int, str], depth: int, source: str
+    ):
+        """
+        Hook for adding related documents to many results at once. Falls back to the
+        per-result _add_related_documents; subclasses override it to fetch related
+        documents for the whole result list with single queries.
+        """
+        for result in results:
+            self._add_related_documents(result, dataset_id, depth, source)
+
+
+    def get_grouped_by_parent_id(
+        self,
+        parent_field: str,
+        parent_ids: list,
+        dataset_id: Union[int, str],
+        depth: int = 0,
+        source: str = "",
+    ):
+        """
+        Generic method for getting documents of many parents with a single '$in' query,
+        grouped by the parent reference field. Callers expanding a batch of parents use
+        this instead of one get_multiple per parent.
+
+        Args:
+            parent_field: Name of the field referencing the parent document
+            parent_ids: Ids of parent documents
+            dataset_id (int | str): name of dataset
+            depth: This specifies the number of collections that are to be traversed
+            source: Helper arguments that specifies direction of collection traversion
+
+        Returns:
+            Dict mapping each given parent id to list of result dictionaries
+        """
+        results = self.get_multiple(
+            dataset_id,
+            {parent_field: self.mongo_api_service.get_id_in_query(parent_ids)},
+            depth=depth,
+            source=source,
+        )
+        grouped = {str(parent_id): [] for parent_id in parent_ids}
+        for result in results:
+            bucket = grouped.get(str(result.get(parent_field)))
+            if bucket is not None:
+                bucket.append(result)
+        return grouped
+
+    def iter_multiple(
+        self, dataset_id: Union[int, str], query: dict = {}, depth: int = 0, source: str = "", *args, **kwargs
+    ):
+        """
+        Generic method for iterating over many documents from mongo api. Unlike
+        get_multiple, documents are streamed from the cursor one at a time, so only the
+        currently processed document is resident in memory.
+
+        Args:
+            dataset_id (int | str): name of dataset
+            query: Query to mongo api. Empty by default.
+            depth: This specifies the number of collections that are to be traversed
+            source: Helper arguments that specifies direction of collection traversion
+
+        Yields:
+            Results of request as dictionaries
+        """
+        collection_name = get_collection_name(self.model_out_class)
+        for result in self.mongo_api_service.iter_documents(
+            collection_name, dataset_id, query, *args, **kwargs
+        ):
+            self._add_related_documents(result, dataset_id, depth, source)
+            yield result
 
     def get_single_dict(
         self, id: Union[str, int], dataset_id: Union[int, str], depth: int = 0, source: str = "", *args, **kwargs
@@ -81,6 +200,17 @@ class GenericMongoServiceMixin:
             Result of request as a dictionary
         """
         collection_name = get_collection_name(self.model_out_class)
+        use_cache = not args and not kwargs
+        cache_key = (collection_name, str(dataset_id), str(id), depth, source)
+        if use_cache:
+            cached_result = get_cached(cache_key)
+            if cached_result is not None:
+                return cached_result
+            cached_result = get_cached_read(cache_key)
+            if cached_result is not None:
+                set_cached(cache_key, cached_result)
+                return cached_result
+
         result_dict = self.mongo_api_service.get_document(
             id, collection_name, dataset_id, *args, **kwargs
         )
@@ -90,9 +220,40 @@ class GenericMongoServiceMixin:
 
         self._add_related_documents(result_dict, dataset_id, depth, source)
 
+        if use_cache:
+            set_cached(cache_key, result_dict)
+            set_cached_read(cache_key, result_dict)
         return result_dict
 
 
+    def exists(self, id: Union[str, int], dataset_id: Union[int, str]):
+        """
+        Generic method for checking whether a document with given id exists. Cheaper than
+        get_single, as no document is fetched or parsed into a model.
+
+        Args:
+            id: ID of the document.
+            dataset_id (int | str): name of dataset
+
+        Returns:
+            True if document exists, False otherwise
+        """
+        collection_name = get_collection_name(self.model_out_class)
+        # hot FK validations probe the same parent ids over and over, so the result
+        # goes through the same two cache layers as single document reads; the key
+        # shares their prefix and is dropped by the same write-path invalidation
+        cache_key = (collection_name, str(dataset_id), str(id), "exists")
+        cached_result = get_cached(cache_key)
+        if cached_result is None:
+            cached_result = get_cached_read(cache_key)
+        if cached_result is not None:
+            return cached_result
+        result = self.mongo_api_service.document_exists(id, collection_name, dataset_id)
+        if result:
+            set_cached(cache_key, result)
+            set_cached_read(cache_key, result)
+        return result
+
     def get_single(
         self, id: Union[str, int], dataset_id: Union[int, str], depth: int = 0, source: str = "", *args, **kwargs
     ):
@@ -114,6 +275,14 @@ class GenericMongoServiceMixin:
             return result
         return out_class(**result)
 
+    def _out_model_for_document(self, document: dict):
+        """
+        Hook returning the out model class for given document. Services whose
+        collection stores several model variants override it to pick the class from
+        the document's fields instead of the shared model_out_class.
+        """
+        return self.model_out_class
+
     def update(self, id: Union[str, int], updated_object: BaseModel, dataset_id: Union[int, str]):
         """
         Generic method for sending request to mongo api to update single document
@@ -126,18 +295,45 @@ class GenericMongoServiceMixin:
         Returns:
             Updated object
         """
-        get_response = self.get_single(id, dataset_id)
-
-        if type(get_response) is NotFoundByIdModel:
-            return get_response
-
         for field, value in updated_object.dict().items():
             if isinstance(value, date) and not isinstance(value, datetime):
                 setattr(updated_object, field, datetime.combine(value, datetime.min.time()))
 
-        self.mongo_api_service.update_document(id, updated_object, dataset_id)
+        # single atomic replace-and-read-back instead of an existence read, a replace
+        # and a second read; no match doubles as the not-found check
+        collection_name = get_collection_name(type(updated_object))
+        updated_document = self.mongo_api_service.find_one_and_replace_document(
+            collection_name, id, updated_object.dict(), dataset_id
+        )
+        if updated_document is None:
+            return NotFoundByIdModel(
+                id=id,
+                errors={"errors": "document not found"},
+            )
+        self._invalidate_request_cache(id, dataset_id)
+        return self._out_model_for_document(updated_document)(**updated_document)
+
+    def update_raw(self, id: Union[str, int], updated_document: dict, dataset_id: Union[int, str], session=None):
+        """
+        Generic method for sending request to mongo api to update single document with
+        an already serialized dict. Skips model construction and validation, which
+        matters for documents with large embedded arrays.
+
+        Args:
+            id: ID of document to be updated.
+            updated_document: New version of document as dict
+            dataset_id (int | str): name of dataset
+            session: Optional mongo session, used to run the update inside a transaction
 
-        return self.get_single(id, dataset_id)
+        Returns:
+            Updated document as dict
+        """
+        collection_name = get_collection_name(self.model_out_class)
+        self.mongo_api_service.update_document_with_dict(
+            collection_name, id, updated_document, dataset_id, session=session
+        )
+        self._invalidate_request_cache(id, dataset_id)
+        return updated_document
 
     def delete(self, id: Union[str, int], dataset_id: Union[int, str]):
         """
@@ -150,13 +346,26 @@ class GenericMongoServiceMixin:
         Returns:
             Deleted object
         """
-        existing_document = self.get_single(id, dataset_id)
-
-        if existing_document is None:
+        # single atomic delete-and-return instead of a read followed by a delete;
+        # no match doubles as the not-found check
+        collection_name = get_collection_name(self.model_out_class)
+        deleted_document = self.mongo_api_service.find_one_and_delete_document(
+            collection_name, id, dataset_id
+        )
+        if deleted_document is None:
             return NotFoundByIdModel(
                 id=id,
                 errors={"errors": "document with such id not found"},
             )
+        self._invalidate_request_cache(id, dataset_id)
+        return self._out_model_for_document(deleted_document)(**deleted_document)
 
-        self.mongo_api_service.delete_document(existing_document, dataset_id)
-        return existing_document
+    def _invalidate_request_cache(self, id: Union[str, int], dataset_id: Union[int, str]):
+        """
+        Drop request-scoped and process-local cache entries for given document, so reads
+        following a write do not return the stale version.
+        """
+        collection_name = get_collection_name(self.model_out_class)
+        key_prefix = (collection_name, str(dataset_id), str(id))
+        invalidate_cached(key_prefix)
+        invalidate_cached_reads(key_prefix)
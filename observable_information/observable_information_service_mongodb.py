@@ -1,4 +1,6 @@
 from typing import Union
+
+import pymongo
 from bson import ObjectId
 from mongo_service.collection_mapping import Collections
 from mongo_service.service_mixins import GenericMongoServiceMixin
@@ -28,6 +30,17 @@ class ObservableInformationServiceMongoDB(
     model_out_class (Type[BaseModel]): Out class of the model, used by GenericMongoServiceMixin
     """
 
+    # multikey indexes on the embedded foreign keys queried by the modality and life
+    # activity traversals, so recording lookups scan an index instead of the collection
+    EMBEDDED_FK_INDEXES = {
+        "modality_id": [
+            (f"{Collections.OBSERVABLE_INFORMATION}.modality_id", pymongo.ASCENDING)
+        ],
+        "life_activity_id": [
+            (f"{Collections.OBSERVABLE_INFORMATION}.life_activity_id", pymongo.ASCENDING)
+        ],
+    }
+
     def __init__(self):
         super().__init__()
         self.model_out_class = ObservableInformationOut
@@ -93,10 +106,15 @@ class ObservableInformationServiceMongoDB(
         Get multiple observable informations based on query. Query has to be adjusted, as observable
         information documents are embedded within recording documents.
         """
+        # id values have to be converted up front, as the '$elemMatch' projection
+        # below is not part of the query and would otherwise compare raw strings
+        # against the stored ObjectIds and drop every embedded match
+        self.mongo_api_service._fix_input_ids(query)
         recording_query = {
             f"{Collections.OBSERVABLE_INFORMATION}.{field}": value
             for field, value in query.items()
         }
+        self._ensure_embedded_fk_indexes(query, dataset_id)
         recording_results = self.recording_service.get_multiple(
             dataset_id,
             recording_query,
@@ -121,6 +139,108 @@ class ObservableInformationServiceMongoDB(
 
         return result
 
+    def get_multiple_by_modality_ids(
+        self,
+        modality_ids: list,
+        dataset_id: Union[int, str],
+        depth: int = 0,
+        source: str = "",
+    ):
+        """
+        Get observable informations of many modalities with a single recording query,
+        grouped by modality id. Unlike get_multiple with an '$elemMatch' projection,
+        the embedded arrays are fetched whole and filtered here, so every matching
+        observable information is attributed to its modality.
+
+        Returns:
+            Dict mapping each given modality id to list of observable information dicts
+        """
+        modality_ids = [str(modality_id) for modality_id in modality_ids]
+        recording_query = {
+            f"{Collections.OBSERVABLE_INFORMATION}.modality_id": (
+                self.mongo_api_service.get_id_in_query(modality_ids)
+            )
+        }
+        self._ensure_embedded_fk_indexes({"modality_id": None}, dataset_id)
+        recording_results = self.recording_service.get_multiple(
+            dataset_id,
+            recording_query,
+            depth=depth - 1,
+            source=Collections.OBSERVABLE_INFORMATION,
+            projection=self._get_recording_projection({}),
+        )
+        result = {modality_id: [] for modality_id in modality_ids}
+        for recording_result in recording_results:
+            if "observable_informations" not in recording_result:
+                continue
+            observable_informations = recording_result["observable_informations"]
+            del recording_result["observable_informations"]
+            for observable_information in observable_informations:
+                bucket = result.get(str(observable_information.get("modality_id")))
+                if bucket is None:
+                    continue
+                self._add_related_documents(
+                    observable_information,
+                    dataset_id,
+                    depth,
+                    source,
+                    recording_result,
+                )
+                bucket.append(observable_information)
+        return result
+
+    def get_multiple_by_life_activity_ids(
+        self,
+        life_activity_ids: list,
+        dataset_id: Union[int, str],
+        depth: int = 0,
+        source: str = "",
+    ):
+        """
+        Get observable informations of many life activities with a single recording
+        query, grouped by life activity id. Unlike get_multiple with an '$elemMatch'
+        projection, the embedded arrays are fetched whole and filtered here, so every
+        matching observable information is attributed to its life activity.
+
+        Returns:
+            Dict mapping each given life activity id to list of observable information dicts
+        """
+        life_activity_ids = [str(la_id) for la_id in life_activity_ids]
+        recording_query = {
+            f"{Collections.OBSERVABLE_INFORMATION}.life_activity_id": (
+                self.mongo_api_service.get_id_in_query(life_activity_ids)
+            )
+        }
+        self._ensure_embedded_fk_indexes({"life_activity_id": None}, dataset_id)
+        recording_results = self.recording_service.get_multiple(
+            dataset_id,
+            recording_query,
+            depth=depth - 1,
+            source=Collections.OBSERVABLE_INFORMATION,
+            projection=self._get_recording_projection({}),
+        )
+        result = {la_id: [] for la_id in life_activity_ids}
+        for recording_result in recording_results:
+            if "observable_informations" not in recording_result:
+                continue
+            observable_informations = recording_result["observable_informations"]
+            del recording_result["observable_informations"]
+            for observable_information in observable_informations:
+                bucket = result.get(
+                    str(observable_information.get("life_activity_id"))
+                )
+                if bucket is None:
+                    continue
+                self._add_related_documents(
+                    observable_information,
+                    dataset_id,
+                    depth,
+                    source,
+                    recording_result,
+                )
+                bucket.append(observable_information)
+        return result
+
     def get_observable_informations(self, dataset_id: Union[int, str]):
         """
         Send request to mongo api to get all observable informations.
@@ -304,6 +424,14 @@ class ObservableInformationServiceMongoDB(
                 source=Collections.OBSERVABLE_INFORMATION,
             )
 
+    def _ensure_embedded_fk_indexes(self, query: dict, dataset_id: Union[int, str]):
+        for field in query:
+            index = self.EMBEDDED_FK_INDEXES.get(field)
+            if index is not None:
+                self.mongo_api_service.ensure_index(
+                    Collections.RECORDING, index, dataset_id
+                )
+
     @staticmethod
     def _get_recording_projection(query):
         return {
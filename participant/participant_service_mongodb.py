@@ -20,7 +20,6 @@ from grisera import (
 )
 from grisera import ParticipantStateService
 
-from participant.participant_model import BasicParticipantOutToMongo
 
 
 class ParticipantServiceMongoDB(ParticipantService, GenericMongoServiceMixin):
@@ -119,14 +118,15 @@ class ParticipantServiceMongoDB(ParticipantService, GenericMongoServiceMixin):
         participant_state = BasicParticipantStateOut(**participant_state_dict)
 
         participant_id = participant_state.participant_id
-        participant = self.get_single_dict(participant_id, dataset_id)
-        participant_states = participant.get(Collections.PARTICIPANT_STATE, [])
-        if participant_states is None:
-            participant_states = []
-        participant_states.append(participant_state)
-        participant[Collections.PARTICIPANT_STATE] = participant_states
-
-        self.update(participant_id, BasicParticipantOutToMongo(**participant), dataset_id)
+        with self.mongo_api_service.transaction() as session:
+            participant = self.get_single_dict(participant_id, dataset_id, session=session)
+            participant_states = participant.get(Collections.PARTICIPANT_STATE, [])
+            if participant_states is None:
+                participant_states = []
+            participant_states.append(participant_state.dict())
+            participant[Collections.PARTICIPANT_STATE] = participant_states
+
+            self.update_raw(participant_id, participant, dataset_id, session=session)
         return BasicParticipantStateOut(**participant_state_dict)
 
     def update_participant_state(
@@ -147,26 +147,29 @@ class ParticipantServiceMongoDB(ParticipantService, GenericMongoServiceMixin):
             Updated participant state
         """
         participant_id = participant_state_dict["participant_id"]
-        participant = self.get_single_dict(participant_id, dataset_id)
-        if type(participant) is NotFoundByIdModel:
-            return NotFoundByIdModel(
-                id=participant_state_id,
-                errors={
-                    "errors": "participant related to given participant state not found"
-                },
-            )
+        with self.mongo_api_service.transaction() as session:
+            participant = self.get_single_dict(participant_id, dataset_id, session=session)
+            if type(participant) is NotFoundByIdModel:
+                return NotFoundByIdModel(
+                    id=participant_state_id,
+                    errors={
+                        "errors": "participant related to given participant state not found"
+                    },
+                )
 
-        to_update_index = self._get_participant_state_index_from_participant(
-            participant, participant_state_id
-        )
-        if to_update_index is None:
-            return NotFoundByIdModel(
-                id=participant_state_id,
-                errors={"errors": "participant state not found"},
+            to_update_index = self._get_participant_state_index_from_participant(
+                participant, participant_state_id
             )
-        participant_states = participant[Collections.PARTICIPANT_STATE]
-        participant_states[to_update_index] = BasicParticipantStateOut(**participant_state_dict)
-        self.update(participant_id, BasicParticipantOutToMongo(**participant), dataset_id)
+            if to_update_index is None:
+                return NotFoundByIdModel(
+                    id=participant_state_id,
+                    errors={"errors": "participant state not found"},
+                )
+            participant_states = participant[Collections.PARTICIPANT_STATE]
+            participant_states[to_update_index] = BasicParticipantStateOut(
+                **participant_state_dict
+            ).dict()
+            self.update_raw(participant_id, participant, dataset_id, session=session)
         return ParticipantStateOut(**participant_state_dict)
 
     def remove_participant_state(self, participant_state: ParticipantStateOut, dataset_id: Union[int, str]):
@@ -181,26 +184,27 @@ class ParticipantServiceMongoDB(ParticipantService, GenericMongoServiceMixin):
             Removed participant state
         """
         participant_id = participant_state.participant_id
-        participant = self.get_single_dict(participant_id, dataset_id)
-        if type(participant) is NotFoundByIdModel:
-            return NotFoundByIdModel(
-                id=participant_state.id,
-                errors={
-                    "errors": "participant related to given participant state not found"
-                },
-            )
+        with self.mongo_api_service.transaction() as session:
+            participant = self.get_single_dict(participant_id, dataset_id, session=session)
+            if type(participant) is NotFoundByIdModel:
+                return NotFoundByIdModel(
+                    id=participant_state.id,
+                    errors={
+                        "errors": "participant related to given participant state not found"
+                    },
+                )
 
-        to_remove_index = self._get_participant_state_index_from_participant(
-            participant, participant_state.id
-        )
-        if to_remove_index is None:
-            return NotFoundByIdModel(
-                id=participant_state.id,
-                errors={"errors": "participant state not found"},
+            to_remove_index = self._get_participant_state_index_from_participant(
+                participant, participant_state.id
             )
-        del participant[Collections.PARTICIPANT_STATE][to_remove_index]
+            if to_remove_index is None:
+                return NotFoundByIdModel(
+                    id=participant_state.id,
+                    errors={"errors": "participant state not found"},
+                )
+            del participant[Collections.PARTICIPANT_STATE][to_remove_index]
 
-        self.update(participant_id, BasicParticipantOutToMongo(**participant), dataset_id)
+            self.update_raw(participant_id, participant, dataset_id, session=session)
         return participant_state
 
     def _get_participant_state_index_from_participant(
@@ -210,11 +214,12 @@ class ParticipantServiceMongoDB(ParticipantService, GenericMongoServiceMixin):
         Participant state is embedded within participant model
         """
         participant_states = participant_dict[Collections.PARTICIPANT_STATE]
+        target_id = str(ObjectId(participant_state_id))
         return next(
             (
                 i
                 for i, ps in enumerate(participant_states)
-                if ObjectId(ps["id"]) == ObjectId(participant_state_id)
+                if str(ps["id"]) == target_id
             ),
             None,
         )
@@ -61,6 +61,10 @@ class ParticipantStateServiceMongoDB(ParticipantStateService, GenericMongoServic
         Get multiple participant states based on query. Query has to be adjusted, as participant states
         documents are embedded within participant documents.
         """
+        # id values have to be converted up front, as the '$elemMatch' projection
+        # below is not part of the query and would otherwise compare raw strings
+        # against the stored ObjectIds and drop every embedded match
+        self.mongo_api_service._fix_input_ids(query)
         participant_query = {
             f"{Collections.PARTICIPANT_STATE}.{field}": value
             for field, value in query.items()
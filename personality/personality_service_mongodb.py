@@ -76,6 +76,13 @@ class PersonalityServiceMongoDB(PersonalityService, GenericMongoServiceMixin):
 
         return self.create(personality, dataset_id)
 
+    def _out_model_for_document(self, document: dict):
+        return (
+            PersonalityPanasOut
+            if "negative_affect" in document
+            else PersonalityBigFiveOut
+        )
+
     def get_single(self, id: Union[str, int], dataset_id: Union[int, str], depth: int = 0, source: str = ""):
         personality = self.get_single_dict(id, dataset_id, depth, source)
         if type(personality) is NotFoundByIdModel:
@@ -173,6 +180,9 @@ class PersonalityServiceMongoDB(PersonalityService, GenericMongoServiceMixin):
             return NotFoundByIdModel(id=personality_id, errors="Node not found.")
 
         self.mongo_api_service.update_document(personality_id, personality, dataset_id)
+        # the pre-update document was cached by the reads above; drop it, so the
+        # read-back below and later requests see the new version
+        self._invalidate_request_cache(personality_id, dataset_id)
         return self.get_personality(personality_id, dataset_id)
 
     def update_personality_panas(
@@ -204,6 +214,7 @@ class PersonalityServiceMongoDB(PersonalityService, GenericMongoServiceMixin):
             return NotFoundByIdModel(id=personality_id, errors="Node not found.")
 
         self.mongo_api_service.update_document(personality_id, personality, dataset_id)
+        self._invalidate_request_cache(personality_id, dataset_id)
         return self.get_personality(personality_id, dataset_id)
 
     def _add_related_documents(
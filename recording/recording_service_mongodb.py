@@ -202,14 +202,15 @@ f
         observable_information = ObservableInformationOut(**observable_information_dict)
 
         recording_id = observable_information.recording_id
-        recording = self.get_single_dict(recording_id, dataset_id)
-        observable_informations = recording.get(Collections.OBSERVABLE_INFORMATION, [])
-        if observable_informations is None:
-            observable_informations = []
-        observable_informations.append(observable_information)
-        recording[Collections.OBSERVABLE_INFORMATION] = observable_informations
-
-        self.update(recording_id, RecordingOut(**recording), dataset_id)
+        with self.mongo_api_service.transaction() as session:
+            recording = self.get_single_dict(recording_id, dataset_id, session=session)
+            observable_informations = recording.get(Collections.OBSERVABLE_INFORMATION, [])
+            if observable_informations is None:
+                observable_informations = []
+            observable_informations.append(observable_information.dict())
+            recording[Collections.OBSERVABLE_INFORMATION] = observable_informations
+
+            self.update_raw(recording_id, recording, dataset_id, session=session)
         return ObservableInformationOut(**observable_information_dict)
 
     def update_observable_information(
@@ -230,18 +231,21 @@ f
         """
         self.remove_observable_information(ObservableInformationOut(**observable_information_dict), dataset_id)
         recording_id = observable_information_dict["recording_id"]
-        recording = self.get_single_dict(recording_id, dataset_id)
-        if type(recording) is NotFoundByIdModel:
-            return NotFoundByIdModel(
-                id=observable_information_id,
-                errors={
-                    "errors": "recording related to given observable information not found"
-                },
-            )
+        with self.mongo_api_service.transaction() as session:
+            recording = self.get_single_dict(recording_id, dataset_id, session=session)
+            if type(recording) is NotFoundByIdModel:
+                return NotFoundByIdModel(
+                    id=observable_information_id,
+                    errors={
+                        "errors": "recording related to given observable information not found"
+                    },
+                )
 
-        observable_informations = recording[Collections.OBSERVABLE_INFORMATION]
-        observable_informations.append(ObservableInformationOut(**observable_information_dict))
-        self.update(recording_id, RecordingOut(**recording), dataset_id)
+            observable_informations = recording[Collections.OBSERVABLE_INFORMATION]
+            observable_informations.append(
+                ObservableInformationOut(**observable_information_dict).dict()
+            )
+            self.update_raw(recording_id, recording, dataset_id, session=session)
         return ObservableInformationOut(**observable_information_dict)
 
     def remove_observable_information(
@@ -258,27 +262,27 @@ f
         """
         observable_information_old = self.observable_information_service.get_observable_information(observable_information.id, dataset_id)
         recording_old_id = observable_information_old.recording_id
-        recording_old = self.get_single_dict(recording_old_id, dataset_id)
-        if type(recording_old) is NotFoundByIdModel:
-            return NotFoundByIdModel(
-                id=observable_information.id,
-                errors={
-                    "errors": "recording related to given observable information not found"
-                },
-            )
-
+        with self.mongo_api_service.transaction() as session:
+            recording_old = self.get_single_dict(recording_old_id, dataset_id, session=session)
+            if type(recording_old) is NotFoundByIdModel:
+                return NotFoundByIdModel(
+                    id=observable_information.id,
+                    errors={
+                        "errors": "recording related to given observable information not found"
+                    },
+                )
 
-        to_remove_index = self._get_observable_information_index_from_recording(
-            recording_old, observable_information.id
-        )
-        if to_remove_index is None:
-            return NotFoundByIdModel(
-                id=observable_information.id,
-                errors={"errors": "observable information not found"},
+            to_remove_index = self._get_observable_information_index_from_recording(
+                recording_old, observable_information.id
             )
-        del recording_old[Collections.OBSERVABLE_INFORMATION][to_remove_index]
+            if to_remove_index is None:
+                return NotFoundByIdModel(
+                    id=observable_information.id,
+                    errors={"errors": "observable information not found"},
+                )
+            del recording_old[Collections.OBSERVABLE_INFORMATION][to_remove_index]
 
-        self.update(recording_old_id, RecordingOut(**recording_old), dataset_id)
+            self.update_raw(recording_old_id, recording_old, dataset_id, session=session)
         return observable_information
 
     def _add_related_documents(self, recording: dict, dataset_id: Union[int, str], depth: int, source: str):
@@ -331,11 +335,12 @@ f
         Observable information is embedded within recording model
         """
         observable_informations = recording_dict[Collections.OBSERVABLE_INFORMATION]
+        target_id = str(ObjectId(observable_information_id))
         return next(
             (
                 i
                 for i, oi in enumerate(observable_informations)
-                if ObjectId(oi["id"]) == ObjectId(observable_information_id)
+                if str(oi["id"]) == target_id
             ),
             None,
         )
@@ -162,6 +162,9 @@ class RegisteredChannelServiceMongoDB(
             updated_registered_channel,
             dataset_id,
         )
+        # the pre-update document was cached by the read above; drop it, so the
+        # read-back below and later requests see the new version
+        self._invalidate_request_cache(registered_channel_id, dataset_id)
         return self.get_registered_channel(registered_channel_id, dataset_id)
 
     def delete_registered_channel(self, registered_channel_id: Union[str, int], dataset_id: Union[int, str]):
@@ -121,6 +121,9 @@ class ScenarioServiceMongoDB(ScenarioService, GenericMongoServiceMixin):
         self.mongo_api_service.update_document_with_dict(
             Collections.SCENARIO, scenario_id, scenario_dict_new, dataset_id
         )
+        # the pre-update scenario may be cached by earlier reads; drop it, so the
+        # read-back below and later requests see the new version
+        self._invalidate_request_cache(scenario_id, dataset_id)
 
         return self.get_scenario(scenario_id, dataset_id)
 
@@ -146,6 +149,7 @@ class ScenarioServiceMongoDB(ScenarioService, GenericMongoServiceMixin):
         self.mongo_api_service.update_document_with_dict(
             Collections.SCENARIO, scenario_id, scenario_dict, dataset_id
         )  # update must be performed with dict, as model is different from saved scenarios (only ae ids are stored)
+        self._invalidate_request_cache(scenario_id, dataset_id)
 
         return self.get_scenario(scenario_id, dataset_id)
 
@@ -198,6 +202,7 @@ class ScenarioServiceMongoDB(ScenarioService, GenericMongoServiceMixin):
         self.mongo_api_service.update_document_with_dict(
             Collections.SCENARIO, scenario.id, scenario_dict, dataset_id
         )  # update must be performed with dict, as model is different from saved scenarios (only ae ids are stored)
+        self._invalidate_request_cache(scenario.id, dataset_id)
 
     def delete_activity_execution(self, activity_execution_id: Union[int, str], dataset_id: Union[int, str]):
         """
@@ -222,6 +227,7 @@ class ScenarioServiceMongoDB(ScenarioService, GenericMongoServiceMixin):
         self.mongo_api_service.update_document_with_dict(
             Collections.SCENARIO, scenario.id, scenario_dict, dataset_id
         )  # update must be performed with dict, as model is different from saved scenarios (only ae ids are stored)
+        self._invalidate_request_cache(scenario.id, dataset_id)
 
         return self.activity_execution_service.get_activity_execution(
             activity_execution_id, dataset_id
@@ -241,6 +247,7 @@ class ScenarioServiceMongoDB(ScenarioService, GenericMongoServiceMixin):
         self.mongo_api_service.update_document_with_dict(
             Collections.SCENARIO, scenario.id, scenario_dict, dataset_id
         )  # update must be performed with dict, as model is different from saved scenarios (only ae ids are stored)
+        self._invalidate_request_cache(scenario.id, dataset_id)
 
         return self.get_scenario(scenario.id, dataset_id)
 
@@ -350,6 +357,89 @@ class ScenarioServiceMongoDB(ScenarioService, GenericMongoServiceMixin):
 
             return ScenarioOut(**scenario)
 
+    def get_scenarios_by_activity_execution_ids(
+            self,
+            activity_execution_ids: List[Union[int, str]],
+            dataset_id: Union[int, str],
+            depth: int = 0,
+            source: str = "",
+    ):
+        """
+        Send request to mongo api to get scenarios which include any of given activity
+        executions. All scenarios are fetched with a single query and grouped by
+        activity execution id, so callers iterating over many activity executions can
+        avoid a query per execution.
+
+        Args:
+            activity_execution_ids (list): identities of activity executions included in scenarios
+            dataset_id (int | str): name of dataset containing activity executions
+            depth: (int): specifies how many related entities will be traversed to create the response
+            source (str): internal argument for mongo services, used to tell the direction of model fetching
+
+        Returns:
+            Dict mapping each given activity execution id to list of Scenario objects
+        """
+        activity_execution_ids = [str(ae_id) for ae_id in activity_execution_ids]
+        query = {
+            "activity_executions": {
+                "$elemMatch": {"$elemMatch": {"$in": activity_execution_ids}}
+            }
+        }
+        scenarios = self.get_multiple(dataset_id, query, source=source)
+
+        scenarios_by_execution = {ae_id: [] for ae_id in activity_execution_ids}
+        for scenario in scenarios:
+            scenario_ae_ids = {
+                ae_id
+                for ae_id_list in scenario["activity_executions"]
+                for ae_id in ae_id_list
+            }
+            scenario = self._change_ids_to_objects(
+                scenario, dataset_id, depth, source=source
+            )
+            scenario_out = ScenarioOut(**scenario)
+            for ae_id in scenario_ae_ids:
+                if ae_id in scenarios_by_execution:
+                    scenarios_by_execution[ae_id].append(scenario_out)
+
+        return scenarios_by_execution
+
+    def get_scenarios_by_experiment_ids(
+            self,
+            experiment_ids: List[Union[int, str]],
+            dataset_id: Union[int, str],
+            depth: int = 0,
+            source: str = "",
+    ):
+        """
+        Send request to mongo api to get scenarios of many experiments. All scenarios
+        are fetched with a single query and grouped by experiment id, so callers
+        iterating over many experiments can avoid a query per experiment.
+
+        Args:
+            experiment_ids (list): identities of experiments where scenarios start
+            dataset_id (int | str): name of dataset containing experiments
+            depth (int): specifies how many related entities will be traversed to create the response
+            source (str): internal argument for mongo services, used to tell the direction of model fetching
+
+        Returns:
+            Dict mapping each given experiment id to list of Scenario objects
+        """
+        experiment_ids = [str(experiment_id) for experiment_id in experiment_ids]
+        query = {"experiment_id": self.mongo_api_service.get_id_in_query(experiment_ids)}
+        scenarios = self.get_multiple(dataset_id, query, source=source)
+
+        scenarios_by_experiment = {experiment_id: [] for experiment_id in experiment_ids}
+        for scenario in scenarios:
+            experiment_id = str(scenario["experiment_id"])
+            scenario = self._change_ids_to_objects(
+                scenario, dataset_id, depth, source=source
+            )
+            if experiment_id in scenarios_by_experiment:
+                scenarios_by_experiment[experiment_id].append(ScenarioOut(**scenario))
+
+        return scenarios_by_experiment
+
     def get_scenarios_by_experiment(
             self, experiment_id: Union[int, str], dataset_id: Union[int, str], depth: int = 0, source: str = ""
     ):